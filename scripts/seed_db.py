@@ -1,7 +1,7 @@
 from loguru import logger
 
+from domain.age_group import AgeGroup, AgeRange
 from infra.repositories.age_group import AgeGroupRepository
-from infra.schemas.age_group import AgeGroup
 
 
 def run_seed():
@@ -10,21 +10,19 @@ def run_seed():
     try:
         repo = AgeGroupRepository()
 
-        logger.info("Truncating the 'age_groups' table")
-        repo.table.truncate()
-        logger.success("Table 'age_groups' cleared successfully.")
-
         groups_to_add = [
-            AgeGroup(name="Child", min_age=0, max_age=12),
-            AgeGroup(name="Teen", min_age=13, max_age=17),
-            AgeGroup(name="Adult", min_age=18, max_age=64),
-            AgeGroup(name="Senior", min_age=65, max_age=120),
+            AgeGroup(name="Child", age_range=AgeRange(0, 12)),
+            AgeGroup(name="Teen", age_range=AgeRange(13, 17)),
+            AgeGroup(name="Adult", age_range=AgeRange(18, 64)),
+            AgeGroup(name="Senior", age_range=AgeRange(65, 120)),
         ]
 
-        logger.info(f"Adding {len(groups_to_add)} new age groups...")
-        for group in groups_to_add:
-            repo.insert(group)
-            logger.debug(f"Added group: {group.name} ({group.min_age}-{group.max_age})")
+        logger.info(f"Replacing 'age_groups' content with {len(groups_to_add)} age groups...")
+        repo.replace_all(groups_to_add)
+        logger.opt(lazy=True).debug(
+            "Added groups: {}",
+            lambda: ", ".join(f"{g.name} ({g.age_range.min_age}-{g.age_range.max_age})" for g in groups_to_add),
+        )
 
         logger.success("All age groups have been added successfully.")
 
@@ -36,4 +34,4 @@ def run_seed():
 
 
 if __name__ == "__main__":
-    run_seed()
\ No newline at end of file
+    run_seed()
@@ -1,4 +1,5 @@
 from domain.age_group import AgeGroup, AgeGroupInUseError, DuplicateAgeGroupError
+from infra.enumerators.age_group import AgeGroupDeletion
 from infra.repositories.age_group import AgeGroupRepository
 from infra.repositories.enrollment import EnrollmentRepository
 
@@ -25,7 +26,8 @@ class AgeGroupService:
         """Create a new age group with validation.
 
         Validates that the name is unique and the age range doesn't overlap
-        with existing age groups. Creates and persists the new age group.
+        with existing age groups, using the cached index of the stored groups.
+        Creates and persists the new age group.
 
         Args:
             name: Unique name for the age group
@@ -35,10 +37,10 @@ class AgeGroupService:
         Returns:
             The created AgeGroup entity
         """
-        if self._repo.exists(name=name):
+        index = self._repo.index()
+        if name in index.names:
             raise DuplicateAgeGroupError(f"Age group '{name}' already exists.")
-        conflicts = self._repo.find_overlapping(min_age=min_age, max_age=max_age)
-        entity = AgeGroup.create(name, min_age, max_age, conflicts)
+        entity = AgeGroup.create(name, min_age, max_age, index)
         self._repo.insert(entity)
         return entity
 
@@ -46,16 +48,28 @@ class AgeGroupService:
         """Delete an age group after validating it's not in use.
 
         Checks that the age group exists and is not currently being used
-        by any approved enrollments before removing it from storage.
+        by any approved enrollments before removing it from storage, all in
+        a single repository call.
 
         Args:
             name: Name of the age group to delete
         """
-        if not self._repo.exists(name=name):
-            raise KeyError("age group not found")
-        if self._enrollments.exists_by_age_group(name, only_approved=True):
-            raise AgeGroupInUseError(f"age group '{name}' has approved enrollments")
-        self._repo.remove(name=name)
+        match self._repo.delete_if_unused(name, self._has_approved_enrollments):
+            case AgeGroupDeletion.MISSING:
+                raise KeyError("age group not found")
+            case AgeGroupDeletion.IN_USE:
+                raise AgeGroupInUseError(f"age group '{name}' has approved enrollments")
+
+    def _has_approved_enrollments(self, name: str) -> bool:
+        """Check whether any approved enrollment belongs to the age group.
+
+        Args:
+            name: Age group name to check
+
+        Returns:
+            True if approved enrollments reference the group, False otherwise
+        """
+        return self._enrollments.exists_by_age_group(name, only_approved=True)
 
     async def list(self, *, offset: int = 0, limit: int = 100) -> list[AgeGroup]:
         """Retrieve a paginated list of age groups.
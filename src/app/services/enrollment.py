@@ -1,11 +1,23 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Awaitable, Callable
 
 from domain.enrollment import Enrollment, EnrollmentStatus
 from infra.repositories.age_group import AgeGroupRepository
 from infra.repositories.enrollment import EnrollmentRepository
 
+_PENDING_VALUE = EnrollmentStatus.PENDING.value
+
+
+def _epoch_seconds() -> int:
+    """Get current Unix time in whole seconds.
+
+    Returns:
+        Seconds since the epoch
+    """
+    return time.time_ns() // 1_000_000_000
+
 
 class EnrollmentService:
     """Service layer for enrollment operations.
@@ -13,58 +25,79 @@ class EnrollmentService:
     Handles enrollment creation and status retrieval.
     """
 
-    def __init__(self, age_groups: AgeGroupRepository, enrollments: EnrollmentRepository) -> None:
+    def __init__(
+        self,
+        age_groups: AgeGroupRepository,
+        enrollments: EnrollmentRepository,
+        *,
+        clock: Callable[[], int] = _epoch_seconds,
+    ) -> None:
         """Initialize service with repository dependencies.
 
         Args:
             age_groups: Repository for age group data operations
             enrollments: Repository for enrollment data operations
+            clock: Function returning the current Unix time in seconds (default: system clock)
         """
         self._age_groups = age_groups
         self._enrollments = enrollments
+        self._clock = clock
+
+    async def request(
+        self, *, name: str, age: int, cpf: str, publish: Callable[[dict[str, object]], Awaitable[None]]
+    ) -> None:
+        """Record a pending enrollment and publish it for processing.
 
-    async def prepare_request(self, *, name: str, age: int, cpf: str) -> dict[str, object] | None:
-        """Prepare enrollment request with age group validation.
+        The pending record is written in the same repository call that checks
+        whether the CPF is already approved, and put back as it was if the
+        message cannot be published, so a request that was never queued does
+        not stay pending. Repository calls stay on the event loop thread, which
+        is also where reads of the shared TinyDB handle happen, so a write never
+        interleaves with a read of the same file handle.
 
         Args:
             name: Student name for enrollment
             age: Student age for age group matching
             cpf: Student CPF for duplicate checking
+            publish: Coroutine function publishing the enrollment payload
 
-        Returns:
-            Enrollment data dictionary if successful, None if already approved
+        Raises:
+            ValueError: If no age group covers the age
+            PermissionError: If the CPF already has an approved enrollment
         """
         group = self._age_groups.find_covering(age)
         if group is None:
             raise ValueError("no age group covers this age")
 
-        existing = self._enrollments.find_by_cpf(cpf)
-
-        if existing and existing.status == EnrollmentStatus.APPROVED:
-            raise PermissionError("enrollment already approved for this CPF")
-
-        e = Enrollment.create_final(
+        requested_at = self._clock()
+        e = Enrollment(
             name=name,
             age=age,
             cpf=cpf,
-            final_status=EnrollmentStatus.PENDING,
-            existing=existing,
-            requested_at=int(time.time()),
+            status=EnrollmentStatus.PENDING,
+            requested_at=requested_at,
             enrolled_at=None,
             age_group_name=group.name,
         )
 
-        if existing and existing.status == EnrollmentStatus.APPROVED and e is existing:
-            return None
-
-        return {
-            "name": e.name,
-            "age": e.age,
-            "cpf": e.cpf,
-            "requested_at": e.requested_at,
-            "age_group_name": e.age_group_name,
-            "status": e.status.value,
-        }
+        previous = self._enrollments.upsert_pending(e)
+        if previous is not None and previous.status == EnrollmentStatus.APPROVED:
+            raise PermissionError("enrollment already approved for this CPF")
+
+        try:
+            await publish(
+                {
+                    "name": name,
+                    "age": age,
+                    "cpf": cpf,
+                    "requested_at": requested_at,
+                    "age_group_name": group.name,
+                    "status": _PENDING_VALUE,
+                }
+            )
+        except Exception:
+            self._enrollments.revert_pending(e, previous)
+            raise
 
     async def status(self, *, cpf: str) -> Enrollment | None:
         """Find enrollment by CPF.
@@ -32,8 +32,25 @@ class EnrollmentAdminService:
         """
         return self._repo.find_by_cpf(cpf)
 
-    async def list_by_age_group(self, *, name: str, offset: int = 0, limit: int = 100) -> Sequence[Enrollment]:
-        """List enrollments by age group name.
+    async def list_by_age_group_after(
+        self, *, name: str, after: int | None = None, limit: int = 100
+    ) -> tuple[Sequence[Enrollment], int | None]:
+        """List enrollments by age group name using a cursor.
+
+        Args:
+            name: Age group name to filter by
+            after: Position returned with the previous page (default: first page)
+            limit: Maximum number of records to return (default: 100)
+
+        Returns:
+            Tuple of (enrollments matching the age group, position of the last one or None on the last page)
+        """
+        return self._repo.search_after(after=after, limit=limit, age_group_name=name)
+
+    async def page_by_age_group(
+        self, *, name: str, offset: int = 0, limit: int = 100
+    ) -> tuple[Sequence[Enrollment], int]:
+        """List enrollments by age group name together with the total count.
 
         Args:
             name: Age group name to filter by
@@ -41,23 +58,27 @@ class EnrollmentAdminService:
             limit: Maximum number of records to return (default: 100)
 
         Returns:
-            List of enrollments matching the age group
+            Tuple of (enrollments matching the age group, total number of matches)
         """
-        return self._repo.search_by_fields(offset=offset, limit=limit, age_group_name=name)
+        return self._repo.page_by_age_group(name, offset=offset, limit=limit)
 
-    async def count_by_age_group(self, *, name: str) -> int:
-        """Count enrollments by age group name.
+    async def list_by_name_after(
+        self, *, name: str, after: int | None = None, limit: int = 100
+    ) -> tuple[Sequence[Enrollment], int | None]:
+        """List enrollments by student name using a cursor.
 
         Args:
-            name: Age group name to count for
+            name: Student name to filter by
+            after: Position returned with the previous page (default: first page)
+            limit: Maximum number of records to return (default: 100)
 
         Returns:
-            Number of enrollments in the age group
+            Tuple of (enrollments matching the name, position of the last one or None on the last page)
         """
-        return self._repo.count(age_group_name=name)
+        return self._repo.search_after(after=after, limit=limit, name=name)
 
-    async def list_by_name(self, *, name: str, offset: int = 0, limit: int = 100) -> Sequence[Enrollment]:
-        """List enrollments by student name.
+    async def page_by_name(self, *, name: str, offset: int = 0, limit: int = 100) -> tuple[Sequence[Enrollment], int]:
+        """List enrollments by student name together with the total count.
 
         Args:
             name: Student name to filter by
@@ -65,25 +86,29 @@ class EnrollmentAdminService:
             limit: Maximum number of records to return (default: 100)
 
         Returns:
-            List of enrollments matching the name
+            Tuple of (enrollments matching the name, total number of matches)
         """
-        return self._repo.search_by_fields(offset=offset, limit=limit, name=name)
+        return self._repo.page_by_name(name, offset=offset, limit=limit)
 
-    async def count_by_name(self, *, name: str) -> int:
-        """Count enrollments by student name.
+    async def list_by_status_after(
+        self, *, status: EnrollmentStatus, after: int | None = None, limit: int = 100
+    ) -> tuple[Sequence[Enrollment], int | None]:
+        """List enrollments by status using a cursor.
 
         Args:
-            name: Student name to count for
+            status: Enrollment status to filter by
+            after: Position returned with the previous page (default: first page)
+            limit: Maximum number of records to return (default: 100)
 
         Returns:
-            Number of enrollments with the name
+            Tuple of (enrollments with the status, position of the last one or None on the last page)
         """
-        return self._repo.count(name=name)
+        return self._repo.search_after(after=after, limit=limit, status=status.value)
 
-    async def list_by_status(
+    async def page_by_status(
         self, *, status: EnrollmentStatus, offset: int = 0, limit: int = 100
-    ) -> Sequence[Enrollment]:
-        """List enrollments by status.
+    ) -> tuple[Sequence[Enrollment], int]:
+        """List enrollments by status together with the total count.
 
         Args:
             status: Enrollment status to filter by
@@ -91,37 +116,32 @@ class EnrollmentAdminService:
             limit: Maximum number of records to return (default: 100)
 
         Returns:
-            List of enrollments with the status
+            Tuple of (enrollments with the status, total number of matches)
         """
-        return self._repo.search_by_fields(offset=offset, limit=limit, status=status.value)
+        return self._repo.page_by_status(status, offset=offset, limit=limit)
 
-    async def count_by_status(self, *, status: EnrollmentStatus) -> int:
-        """Count enrollments by status.
+    async def get_all_after(
+        self, *, after: int | None = None, limit: int = 100
+    ) -> tuple[Sequence[Enrollment], int | None]:
+        """Get all enrollments using a cursor.
 
         Args:
-            status: Enrollment status to count for
+            after: Position returned with the previous page (default: first page)
+            limit: Maximum number of records to return (default: 100)
 
         Returns:
-            Number of enrollments with the status
+            Tuple of (enrollments, position of the last one or None on the last page)
         """
-        return self._repo.count(status=status.value)
+        return self._repo.search_after(after=after, limit=limit)
 
-    async def get_all(self, *, offset: int = 0, limit: int = 100) -> Sequence[Enrollment]:
-        """Get all enrollments.
+    async def page_all(self, *, offset: int = 0, limit: int = 100) -> tuple[Sequence[Enrollment], int]:
+        """Get all enrollments together with the total count.
 
         Args:
             offset: Number of records to skip (default: 0)
             limit: Maximum number of records to return (default: 100)
 
         Returns:
-            List of all enrollments
-        """
-        return self._repo.get_all(offset=offset, limit=limit)
-
-    async def count_all(self) -> int:
-        """Count all enrollments.
-
-        Returns:
-            Total number of enrollments
+            Tuple of (enrollments, total number of enrollments)
         """
-        return self._repo.count()
+        return self._repo.search_with_total(offset=offset, limit=limit)
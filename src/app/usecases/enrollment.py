@@ -7,7 +7,13 @@ from domain.enrollment import Enrollment
 
 
 class EnrollmentPublisher(Protocol):
-    def publish(self, payload: dict[str, Any]) -> None: ...
+    async def publish(self, payload: dict[str, Any]) -> None:
+        """Publish an enrollment request and wait until it is accepted.
+
+        Publishing the same CPF more than once is safe: the worker keeps a
+        single record per CPF and never overrides an approved enrollment.
+        """
+        ...
 
 
 class EnrollmentUseCase:
@@ -31,9 +37,7 @@ class EnrollmentUseCase:
             age: Student age for age group matching
             cpf: Student CPF for duplicate checking
         """
-        payload = await self._svc.prepare_request(name=name, age=age, cpf=cpf)
-        if payload:
-            self._publisher.publish(payload)
+        await self._svc.request(name=name, age=age, cpf=cpf, publish=self._publisher.publish)
 
     async def status(self, *, cpf: str) -> Enrollment | None:
         """Find enrollment by CPF.
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
 from dataclasses import dataclass
+from itertools import accumulate
 
 
 class AgeGroupError(Exception):
     """Base exception for age group related errors."""
 
-    ...
+    __slots__ = ()
 
 
 class DuplicateAgeGroupError(AgeGroupError):
     """Raised when attempting to create an age group with a name that already exists."""
 
+    __slots__ = ()
+
     def __init__(self, msg: str = "Age group name already exists."):
         super().__init__(msg)
 
@@ -19,6 +24,8 @@ class DuplicateAgeGroupError(AgeGroupError):
 class AgeGroupOverlapError(AgeGroupError):
     """Raised when an age group's range overlaps with an existing age group."""
 
+    __slots__ = ()
+
     def __init__(self, msg: str = "Age range overlaps an existing group."):
         super().__init__(msg)
 
@@ -26,6 +33,8 @@ class AgeGroupOverlapError(AgeGroupError):
 class AgeGroupInUseError(AgeGroupError):
     """Raised when attempting to delete an age group that is currently in use."""
 
+    __slots__ = ()
+
     def __init__(self, msg: str = "Age group is in use and cannot be deleted."):
         super().__init__(msg)
 
@@ -47,7 +56,7 @@ class AgeRange:
         return self.min_age <= other.max_age and other.min_age <= self.max_age
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class AgeGroup:
     """Named age group with unique name and non-overlapping age range."""
 
@@ -59,12 +68,62 @@ class AgeGroup:
         name: str,
         min_age: int,
         max_age: int,
-        existing: list[AgeGroup],
+        existing: Iterable[AgeGroup] | AgeGroupIndex = (),
     ) -> AgeGroup:
-        """Create validated age group with unique name and non-overlapping range."""
-        if any(g.name == name for g in existing):
+        """Create validated age group with unique name and non-overlapping range.
+
+        Existing groups can be given as a prebuilt index, which makes the name
+        check O(1) and the overlap check O(log n), or as any iterable of
+        groups, which is indexed first.
+        """
+        index = existing if isinstance(existing, AgeGroupIndex) else AgeGroupIndex(existing)
+        if name in index.names:
             raise DuplicateAgeGroupError
         new_range = AgeRange(min_age, max_age)
-        if any(new_range.overlaps(g.age_range) for g in existing):
+        if index.overlaps(new_range):
             raise AgeGroupOverlapError
         return AgeGroup(name=name, age_range=new_range)
+
+
+class AgeGroupIndex:
+    """Read-only index over age groups for name and range lookups.
+
+    Groups are sorted by minimum age next to the running maximum of their
+    upper bounds, so range queries bisect to the candidates instead of
+    testing every group: O(log n + m) for m matches. Names are kept in a set
+    for O(1) uniqueness checks.
+    """
+
+    __slots__ = ("_groups", "_mins", "_reach", "names")
+
+    def __init__(self, groups: Iterable[AgeGroup] = ()) -> None:
+        """Index the given age groups.
+
+        Args:
+            groups: Age groups to index
+        """
+        ordered = sorted(groups, key=lambda g: g.age_range.min_age)
+        self._groups = ordered
+        self._mins = [g.age_range.min_age for g in ordered]
+        self._reach = list(accumulate((g.age_range.max_age for g in ordered), max))
+        self.names = frozenset(g.name for g in ordered)
+
+    def __len__(self) -> int:
+        """Number of indexed age groups."""
+        return len(self._groups)
+
+    def overlaps(self, age_range: AgeRange) -> bool:
+        """Check if any indexed group overlaps the range.
+
+        The first group whose running upper bound reaches ``min_age`` is the
+        only candidate: it ends at or after ``min_age`` and starts before any
+        later group.
+        """
+        start = bisect_left(self._reach, age_range.min_age)
+        return start < len(self._mins) and self._mins[start] <= age_range.max_age
+
+    def overlapping(self, min_age: int, max_age: int) -> list[AgeGroup]:
+        """Get indexed groups overlapping the inclusive range, ordered by minimum age."""
+        start = bisect_left(self._reach, min_age)
+        stop = bisect_right(self._mins, max_age)
+        return [g for g in self._groups[start:stop] if g.age_range.max_age >= min_age]
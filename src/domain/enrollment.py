@@ -1,29 +1,30 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
 from infra.enumerators.enrollment import EnrollmentStatus
 
-_CPF_RE = re.compile(r"^\d{3}\.\d{3}\.\d{3}-\d{2}$")
+_APPROVED = EnrollmentStatus.APPROVED
+_CPF_RE = re.compile(r"[0-9]{3}\.[0-9]{3}\.[0-9]{3}-[0-9]{2}")
 
 
 class EnrollmentError(Exception):
     """Base exception for enrollment related errors."""
 
-    ...
+    __slots__ = ()
 
 
 class DuplicateEnrollmentError(EnrollmentError):
     """Raised when attempting to create a duplicate enrollment for the same CPF."""
 
-    ...
+    __slots__ = ()
 
 
 class IllegalTransitionError(EnrollmentError):
     """Raised when attempting an invalid status transition for an enrollment."""
 
-    ...
+    __slots__ = ()
 
 
 @dataclass(slots=True, frozen=True)
@@ -43,11 +44,37 @@ class Enrollment:
         """Validate age ≥ 0, CPF format, and enrolled_at when APPROVED."""
         if self.age < 0:
             raise ValueError("age must be non-negative")
-        if not _CPF_RE.match(self.cpf):
+        if not _CPF_RE.fullmatch(self.cpf):
             raise ValueError("cpf must match 999.999.999-99 format")
-        if self.status == EnrollmentStatus.APPROVED and self.enrolled_at is None:
+        if self.status == _APPROVED and self.enrolled_at is None:
             raise ValueError("enrolled_at must be set when status is APPROVED")
 
+    @classmethod
+    def from_trusted(
+        cls,
+        name: str,
+        age: int,
+        cpf: str,
+        status: EnrollmentStatus,
+        *,
+        requested_at: int | None = None,
+        enrolled_at: int | None = None,
+        age_group_name: str | None = None,
+    ) -> Enrollment:
+        """Build enrollment from already validated data, skipping ``__post_init__``.
+
+        Meant for records loaded from storage, which were validated when written.
+        """
+        obj = object.__new__(cls)
+        _set_name(obj, name)
+        _set_age(obj, age)
+        _set_cpf(obj, cpf)
+        _set_status(obj, status)
+        _set_requested_at(obj, requested_at)
+        _set_enrolled_at(obj, enrolled_at)
+        _set_age_group_name(obj, age_group_name)
+        return obj
+
     @staticmethod
     def create_final(
         name: str,
@@ -61,7 +88,11 @@ class Enrollment:
         age_group_name: str | None = None,
     ) -> Enrollment:
         """Create/update enrollment with one-per-CPF policy. Returns existing if APPROVED."""
-        candidate = Enrollment(
+        # An approved enrollment is final, so there is no candidate to build.
+        if existing is not None and existing.status == _APPROVED:
+            return existing
+        # No record, REJECTED or anything else -> accept new final
+        return Enrollment(
             name=name,
             age=age,
             cpf=cpf,
@@ -70,9 +101,15 @@ class Enrollment:
             enrolled_at=enrolled_at,
             age_group_name=age_group_name,
         )
-        if existing is None:
-            return candidate
-        if existing.status == EnrollmentStatus.APPROVED:
-            return existing
-        # REJECTED or anything else -> accept new final
-        return candidate
+
+
+# Slot setters used by Enrollment.from_trusted, bypassing the frozen __setattr__.
+# Looked up by field name, so reordering the fields cannot swap them.
+_SETTERS = {f.name: Enrollment.__dict__[f.name].__set__ for f in fields(Enrollment)}
+_set_name = _SETTERS["name"]
+_set_age = _SETTERS["age"]
+_set_cpf = _SETTERS["cpf"]
+_set_status = _SETTERS["status"]
+_set_requested_at = _SETTERS["requested_at"]
+_set_enrolled_at = _SETTERS["enrolled_at"]
+_set_age_group_name = _SETTERS["age_group_name"]
@@ -1,14 +1,22 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import Depends, FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
 from infra.api.age_groups import AgeGroupAPI
 from infra.api.enrollment import EnrollmentAPI
 from infra.api.enrollment_admin import EnrollmentAdminAPI
-from infra.common.logging import LogAPIRoute
+from infra.common.logging import LoggingASGIMiddleware
+from infra.dependencies.enrollment import close_publisher, connect_publisher
+from infra.repositories.age_group import AgeGroupRepository
+from infra.repositories.enrollment import EnrollmentRepository
 from infra.schemas.health import HealthOutput
 from infra.security.basic_auth import BasicAuthGuard
 from settings import Config
 
+_DOCS_ENVS = frozenset(("dev", "hmg", "test", "development"))
+
 
 class APIBuilder:
     """Builder for FastAPI application with enrollment endpoints.
@@ -24,7 +32,7 @@ class APIBuilder:
             allowed_origins: CORS allowed origins (default: ["*"])
         """
         self.cfg = cfg
-        show_docs = cfg.ENVIRONMENT in {"dev", "hmg", "test", "development"}
+        show_docs = cfg.ENVIRONMENT in _DOCS_ENVS
 
         self.app = FastAPI(
             title="Enrollment API",
@@ -32,9 +40,9 @@ class APIBuilder:
             openapi_url="/openapi.json" if show_docs else None,
             docs_url="/docs" if show_docs else None,
             redoc_url="/redoc" if show_docs else None,
+            lifespan=self._lifespan,
         )
 
-        self.app.router.route_class = LogAPIRoute
         self._auth = BasicAuthGuard(cfg.API_USERNAME, cfg.API_PASSWORD)
         self._setup_middlewares(allowed_origins or ["*"])
 
@@ -46,6 +54,21 @@ class APIBuilder:
         """
         return self.app
 
+    @asynccontextmanager
+    async def _lifespan(self, _app: FastAPI) -> AsyncIterator[None]:
+        """Warm up lookup tables and connections on startup and release them on shutdown.
+
+        The TinyDB handle is shared by every app in the process and stays open.
+
+        Args:
+            _app: FastAPI application instance
+        """
+        AgeGroupRepository().warm_up()
+        EnrollmentRepository().warm_up()
+        await connect_publisher()
+        yield
+        await close_publisher()
+
     def build_stack(self) -> None:
         """Register all API routes and endpoints."""
         self._register_health()  # public
@@ -54,11 +77,12 @@ class APIBuilder:
         self._register_enrollment_admin()  # protected
 
     def _setup_middlewares(self, origins: list[str]) -> None:
-        """Setup CORS middleware for the application.
+        """Setup request logging and CORS middlewares for the application.
 
         Args:
             origins: List of allowed origins for CORS
         """
+        self.app.add_middleware(LoggingASGIMiddleware)
         self.app.add_middleware(
             CORSMiddleware,
             allow_origins=origins,
@@ -81,7 +105,7 @@ class APIBuilder:
 
     def _register_age_groups(self) -> None:
         """Register age groups API with authentication."""
-        AgeGroupAPI(self.app, dependencies=[Depends(self._auth)])
+        AgeGroupAPI(self.app, dependencies=(Depends(self._auth),))
 
     def _register_enrollment(self) -> None:
         """Register enrollment API without authentication."""
@@ -89,4 +113,4 @@ class APIBuilder:
 
     def _register_enrollment_admin(self) -> None:
         """Register enrollment admin API with authentication."""
-        EnrollmentAdminAPI(self.app, dependencies=[Depends(self._auth)])
+        EnrollmentAdminAPI(self.app, dependencies=(Depends(self._auth),))
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import Annotated
+from typing import Annotated, ClassVar
 
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, params, status
 
 from app.services.age_group import AgeGroupInUseError
 from app.usecases.age_group import AgeGroupUseCase
 from domain.age_group import AgeGroupOverlapError, DuplicateAgeGroupError
-from infra.common.logging import LogAPIRoute
 from infra.dependencies.age_groups import provide_use_case
 from infra.schemas.age_group import AgeGroup as AgeGroupDTO
 from infra.schemas.pagination import PageResult
@@ -18,8 +17,9 @@ from infra.utils.pagination import Pagination
 class AgeGroupAPI:
     """API layer for age group operations."""
 
-    TAGS = ["Age Groups"]
+    TAGS = ("Age Groups",)
     PREFIX = "/age-groups"
+    _router: ClassVar[APIRouter | None] = None
 
     def __init__(
         self,
@@ -29,16 +29,25 @@ class AgeGroupAPI:
     ) -> None:
         """Initialize API with FastAPI app and optional dependencies.
 
+        Routes are registered on a router built once per process and shared
+        by every app, which only copies them in with its own dependencies.
+
         Args:
             app: FastAPI application instance
             dependencies: Optional dependencies for all routes
         """
-        self.router = APIRouter(
-            dependencies=list(dependencies) if dependencies else None,
-            route_class=LogAPIRoute,
+        cls = type(self)
+        if cls._router is None:
+            self.router = APIRouter()
+            self._register_routes()
+            cls._router = self.router
+        self.router = cls._router
+        app.include_router(
+            self.router,
+            prefix=self.PREFIX,
+            tags=self.TAGS,
+            dependencies=dependencies,
         )
-        self._register_routes()
-        app.include_router(self.router, prefix=self.PREFIX, tags=list(self.TAGS))
 
     def _register_routes(self) -> None:
         """Register all age group API routes."""
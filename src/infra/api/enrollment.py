@@ -1,22 +1,23 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import Annotated
+from typing import Annotated, ClassVar
 
-from fastapi import APIRouter, Depends, FastAPI, HTTPException, Path, params, status
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Path, Request, Response, params, status
 
 from app.usecases.enrollment import EnrollmentUseCase
-from infra.common.logging import LogAPIRoute
 from infra.dependencies.enrollment import provide_use_case
 from infra.schemas.enrollment import Enrollment as EnrollmentDTO
 from infra.schemas.enrollment import EnrollmentCreate
+from infra.utils.etag import CACHE_CONTROL, entity_tag, is_fresh, not_modified
 
 
 class EnrollmentAPI:
     """API layer for enrollment operations."""
 
-    TAGS = ["Enrollments"]
+    TAGS = ("Enrollments",)
     PREFIX = "/enrollments"
+    _router: ClassVar[APIRouter | None] = None
 
     def __init__(
         self,
@@ -26,16 +27,25 @@ class EnrollmentAPI:
     ) -> None:
         """Initialize API with FastAPI app and optional dependencies.
 
+        Routes are registered on a router built once per process and shared
+        by every app, which only copies them in with its own dependencies.
+
         Args:
             app: FastAPI application instance
             dependencies: Optional dependencies for all routes
         """
-        self.router = APIRouter(
-            dependencies=list(dependencies) if dependencies else None,
-            route_class=LogAPIRoute,
+        cls = type(self)
+        if cls._router is None:
+            self.router = APIRouter()
+            self._register_routes()
+            cls._router = self.router
+        self.router = cls._router
+        app.include_router(
+            self.router,
+            prefix=self.PREFIX,
+            tags=self.TAGS,
+            dependencies=dependencies,
         )
-        self._register_routes()
-        app.include_router(self.router, prefix=self.PREFIX, tags=list(self.TAGS))
 
     def _register_routes(self) -> None:
         """Register all enrollment API routes."""
@@ -86,20 +96,26 @@ class EnrollmentAPI:
 
     async def get_status(
         self,
-        cpf: Annotated[str, Path(pattern=r"^\d{3}\.\d{3}\.\d{3}-\d{2}$")],
+        request: Request,
+        response: Response,
+        cpf: Annotated[str, Path(pattern=r"^[0-9]{3}\.[0-9]{3}\.[0-9]{3}-[0-9]{2}$")],
         uc: Annotated[EnrollmentUseCase, Depends(provide_use_case)],
-    ) -> EnrollmentDTO:
+    ) -> EnrollmentDTO | Response:
         """Get enrollment status by CPF.
 
         Retrieves the current enrollment status for a given CPF.
-        CPF must be in the format XXX.XXX.XXX-XX.
+        CPF must be in the format XXX.XXX.XXX-XX. Responses carry an ETag,
+        so clients polling for a decision can revalidate with If-None-Match
+        and get an empty 304 while the status is unchanged.
 
         Args:
+            request: HTTP request object
+            response: Response used to set caching headers
             cpf: CPF to search for (format: XXX.XXX.XXX-XX)
             uc: Enrollment use case dependency
 
         Returns:
-            Enrollment data with current status
+            Enrollment data with current status, or 304 if the client copy is current
 
         Raises:
             HTTPException: 404 if enrollment not found for the given CPF
@@ -107,4 +123,9 @@ class EnrollmentAPI:
         ent = await uc.status(cpf=cpf)
         if not ent:
             raise HTTPException(status_code=404, detail="enrollment not found")
+        etag = entity_tag(ent.name, ent.age, ent.cpf, ent.status.value)
+        if is_fresh(request, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CACHE_CONTROL
         return EnrollmentDTO(name=ent.name, age=ent.age, cpf=ent.cpf, status=ent.status)
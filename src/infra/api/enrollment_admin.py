@@ -1,25 +1,31 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
-from typing import Annotated, Literal
+from collections.abc import Awaitable, Sequence
+from typing import Annotated, ClassVar, Literal
 
-from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, params
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, Response, params
 
 from app.usecases.enrollment_admin import EnrollmentAdminUseCase
 from domain.enrollment import Enrollment
-from infra.common.logging import LogAPIRoute
 from infra.dependencies.enrollment_admin import provide_admin_use_case
 from infra.enumerators.enrollment import EnrollmentStatus
 from infra.schemas.enrollment_admin import EnrollmentAdmin as EnrollmentDTO
 from infra.schemas.pagination import PageResult
-from infra.utils.pagination import Pagination
+from infra.utils.etag import CACHE_CONTROL, entity_tag, is_fresh, not_modified
+from infra.utils.pagination import Pagination, decode_cursor, encode_cursor
+
+_AFTER_DESCRIPTION = (
+    "Cursor from links.next_cursor of the previous page; pass it empty to start. "
+    "Pages by cursor instead of page number, which stays fast on deep pages."
+)
 
 
 class EnrollmentAdminAPI:
     """API layer for enrollment admin operations."""
 
-    TAGS = ["Enrollments Admin"]
+    TAGS = ("Enrollments Admin",)
     PREFIX = "/enrollments/admin"
+    _router: ClassVar[APIRouter | None] = None
 
     def __init__(
         self,
@@ -29,16 +35,25 @@ class EnrollmentAdminAPI:
     ) -> None:
         """Initialize API with FastAPI app and optional dependencies.
 
+        Routes are registered on a router built once per process and shared
+        by every app, which only copies them in with its own dependencies.
+
         Args:
             app: FastAPI application instance
             dependencies: Optional dependencies for all routes
         """
-        self.router = APIRouter(
-            dependencies=list(dependencies) if dependencies else None,
-            route_class=LogAPIRoute,
+        cls = type(self)
+        if cls._router is None:
+            self.router = APIRouter()
+            self._register_routes()
+            cls._router = self.router
+        self.router = cls._router
+        app.include_router(
+            self.router,
+            prefix=self.PREFIX,
+            tags=self.TAGS,
+            dependencies=dependencies,
         )
-        self._register_routes()
-        app.include_router(self.router, prefix=self.PREFIX, tags=list(self.TAGS))
 
     def _register_routes(self) -> None:
         """Register all enrollment admin API routes."""
@@ -79,31 +94,58 @@ class EnrollmentAdminAPI:
         )
 
     @staticmethod
-    def _to_dto(e: Enrollment) -> EnrollmentDTO:
-        """Convert domain enrollment to DTO.
+    def _decode_after(after: str) -> int | None:
+        """Decode the cursor given by the client.
+
+        Args:
+            after: Cursor of the previous page, or empty for the first page
+
+        Returns:
+            Position to resume after, None for the first page
+
+        Raises:
+            HTTPException: 400 if the cursor is malformed
+        """
+        if not after:
+            return None
+        try:
+            return decode_cursor(after)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    @staticmethod
+    async def _cursor_page(
+        request: Request,
+        page_size: int,
+        fetch: Awaitable[tuple[Sequence[Enrollment], int | None]],
+    ) -> PageResult[EnrollmentDTO]:
+        """Build a page fetched by cursor.
 
         Args:
-            e: Domain enrollment object
+            request: HTTP request object
+            page_size: Number of items per page
+            fetch: Pending use case call returning the items and the position of the last one
 
         Returns:
-            Enrollment DTO
+            Page of enrollments with a link to the next page
         """
-        return EnrollmentDTO(
-            name=e.name,
-            age=e.age,
-            cpf=e.cpf,
-            status=e.status,
-            requested_at=e.requested_at,
-            enrolled_at=e.enrolled_at,
-            age_group_name=e.age_group_name,
+        items, last = await fetch
+        return Pagination[EnrollmentDTO].create_after(
+            request=request,
+            items=items,
+            page_size=page_size,
+            next_cursor=encode_cursor(last) if last is not None else None,
+            schema_class=EnrollmentDTO,
         )
 
     async def get_all(
         self,
+        *,
         request: Request,
         uc: Annotated[EnrollmentAdminUseCase, Depends(provide_admin_use_case)],
         page: Annotated[int, Query(ge=1)] = 1,
         page_size: Annotated[int, Query(gt=0)] = 100,
+        after: Annotated[str | None, Query(description=_AFTER_DESCRIPTION)] = None,
     ) -> PageResult[EnrollmentDTO]:
         """Get all enrollments with pagination.
 
@@ -115,17 +157,22 @@ class EnrollmentAdminAPI:
             uc: Enrollment admin use case dependency
             page: Page number (default: 1)
             page_size: Number of items per page (default: 100)
+            after: Cursor of the previous page, or empty for the first page, to page by cursor
 
         Returns:
             Paginated list of all enrollments
+
+        Raises:
+            HTTPException: 400 if the cursor is malformed
         """
+        if after is not None:
+            position = self._decode_after(after)
+            return await self._cursor_page(request, page_size, uc.get_all_after(after=position, limit=page_size))
         offset = (page - 1) * page_size
-        total = await uc.count_all()
-        items = await uc.get_all(offset=offset, limit=page_size)
-        dto_items = [self._to_dto(x) for x in items]
+        items, total = await uc.page_all(offset=offset, limit=page_size)
         return Pagination[EnrollmentDTO].create(
             request=request,
-            items=dto_items,
+            items=items,
             total_items=total,
             page=page,
             page_size=page_size,
@@ -134,20 +181,25 @@ class EnrollmentAdminAPI:
 
     async def get_by_cpf(
         self,
+        request: Request,
+        response: Response,
         cpf: str,
         uc: Annotated[EnrollmentAdminUseCase, Depends(provide_admin_use_case)],
-    ) -> EnrollmentDTO:
+    ) -> EnrollmentDTO | Response:
         """Get enrollment by CPF.
 
         Retrieves detailed enrollment information for a specific CPF,
-        including all status history and timestamps.
+        including all status history and timestamps. Supports revalidation
+        through ETag and If-None-Match.
 
         Args:
+            request: HTTP request object
+            response: Response used to set caching headers
             cpf: CPF to search for
             uc: Enrollment admin use case dependency
 
         Returns:
-            Enrollment data with full details
+            Enrollment data with full details, or 304 if the client copy is current
 
         Raises:
             HTTPException: 404 if enrollment not found for the given CPF
@@ -155,15 +207,22 @@ class EnrollmentAdminAPI:
         e = await uc.get_by_cpf(cpf=cpf)
         if not e:
             raise HTTPException(status_code=404, detail="enrollment not found")
-        return self._to_dto(e)
+        etag = entity_tag(e.name, e.age, e.cpf, e.status.value, e.requested_at, e.enrolled_at, e.age_group_name)
+        if is_fresh(request, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CACHE_CONTROL
+        return EnrollmentDTO.model_validate(e)
 
     async def list_by_age_group(
         self,
+        *,
         request: Request,
         name: str,
         uc: Annotated[EnrollmentAdminUseCase, Depends(provide_admin_use_case)],
         page: Annotated[int, Query(ge=1)] = 1,
         page_size: Annotated[int, Query(gt=0)] = 100,
+        after: Annotated[str | None, Query(description=_AFTER_DESCRIPTION)] = None,
     ) -> PageResult[EnrollmentDTO]:
         """List enrollments by age group with pagination.
 
@@ -176,17 +235,26 @@ class EnrollmentAdminAPI:
             uc: Enrollment admin use case dependency
             page: Page number (default: 1)
             page_size: Number of items per page (default: 100)
+            after: Cursor of the previous page, or empty for the first page, to page by cursor
 
         Returns:
             Paginated list of enrollments in the age group
+
+        Raises:
+            HTTPException: 400 if the cursor is malformed
         """
+        if after is not None:
+            position = self._decode_after(after)
+            return await self._cursor_page(
+                request,
+                page_size,
+                uc.list_by_age_group_after(name=name, after=position, limit=page_size),
+            )
         offset = (page - 1) * page_size
-        total = await uc.count_by_age_group(name=name)
-        items = await uc.list_by_age_group(name=name, offset=offset, limit=page_size)
-        dto_items = [self._to_dto(x) for x in items]
+        items, total = await uc.page_by_age_group(name=name, offset=offset, limit=page_size)
         return Pagination[EnrollmentDTO].create(
             request=request,
-            items=dto_items,
+            items=items,
             total_items=total,
             page=page,
             page_size=page_size,
@@ -195,11 +263,13 @@ class EnrollmentAdminAPI:
 
     async def list_by_name(
         self,
+        *,
         request: Request,
         name: Annotated[str, Query(min_length=1)],
         uc: Annotated[EnrollmentAdminUseCase, Depends(provide_admin_use_case)],
         page: Annotated[int, Query(ge=1)] = 1,
         page_size: Annotated[int, Query(gt=0)] = 100,
+        after: Annotated[str | None, Query(description=_AFTER_DESCRIPTION)] = None,
     ) -> PageResult[EnrollmentDTO]:
         """List enrollments by student name with pagination.
 
@@ -212,17 +282,24 @@ class EnrollmentAdminAPI:
             uc: Enrollment admin use case dependency
             page: Page number (default: 1)
             page_size: Number of items per page (default: 100)
+            after: Cursor of the previous page, or empty for the first page, to page by cursor
 
         Returns:
             Paginated list of enrollments matching the name
+
+        Raises:
+            HTTPException: 400 if the cursor is malformed
         """
+        if after is not None:
+            position = self._decode_after(after)
+            return await self._cursor_page(
+                request, page_size, uc.list_by_name_after(name=name, after=position, limit=page_size)
+            )
         offset = (page - 1) * page_size
-        total = await uc.count_by_name(name=name)
-        items = await uc.list_by_name(name=name, offset=offset, limit=page_size)
-        dto_items = [self._to_dto(x) for x in items]
+        items, total = await uc.page_by_name(name=name, offset=offset, limit=page_size)
         return Pagination[EnrollmentDTO].create(
             request=request,
-            items=dto_items,
+            items=items,
             total_items=total,
             page=page,
             page_size=page_size,
@@ -231,11 +308,13 @@ class EnrollmentAdminAPI:
 
     async def list_by_status(
         self,
+        *,
         request: Request,
         status_: Annotated[Literal["APPROVED", "REJECTED"], Query(alias="status")],
         uc: Annotated[EnrollmentAdminUseCase, Depends(provide_admin_use_case)],
         page: Annotated[int, Query(ge=1)] = 1,
         page_size: Annotated[int, Query(gt=0)] = 100,
+        after: Annotated[str | None, Query(description=_AFTER_DESCRIPTION)] = None,
     ) -> PageResult[EnrollmentDTO]:
         """List enrollments by status with pagination.
 
@@ -248,28 +327,26 @@ class EnrollmentAdminAPI:
             uc: Enrollment admin use case dependency
             page: Page number (default: 1)
             page_size: Number of items per page (default: 100)
+            after: Cursor of the previous page, or empty for the first page, to page by cursor
 
         Returns:
             Paginated list of enrollments with the specified status
+
+        Raises:
+            HTTPException: 400 if the cursor is malformed
         """
+        if after is not None:
+            position = self._decode_after(after)
+            return await self._cursor_page(
+                request,
+                page_size,
+                uc.list_by_status_after(status=EnrollmentStatus(status_), after=position, limit=page_size),
+            )
         offset = (page - 1) * page_size
-        status_enum = EnrollmentStatus(status_)
-        total = await uc.count_by_status(status=status_enum)
-        items = await uc.list_by_status(status=status_enum, offset=offset, limit=page_size)
+        items, total = await uc.page_by_status(status=EnrollmentStatus(status_), offset=offset, limit=page_size)
         return Pagination[EnrollmentDTO].create(
             request=request,
-            items=[
-                EnrollmentDTO(
-                    name=i.name,
-                    age=i.age,
-                    cpf=i.cpf,
-                    status=i.status,
-                    requested_at=i.requested_at,
-                    enrolled_at=i.enrolled_at,
-                    age_group_name=i.age_group_name,
-                )
-                for i in items
-            ],
+            items=items,
             total_items=total,
             page=page,
             page_size=page_size,
@@ -1,237 +1,288 @@
+import codecs
 import json
 import time
 from collections.abc import Callable
+from contextlib import suppress
+from functools import partial
 from typing import Any
+from urllib.parse import parse_qsl
 
-from fastapi import HTTPException, Request, Response, status
-from fastapi.exceptions import RequestValidationError
-from fastapi.routing import APIRoute
+from fastapi import status
 from loguru import logger
-from starlette.datastructures import UploadFile
+from starlette.datastructures import URL, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+_Utf8Decoder = codecs.getincrementaldecoder("utf-8")
+# Request headers copied into the log record, by raw (lower-case) ASGI name.
+_REQUESTER_HEADERS = {
+    b"host": "host",
+    b"x-forwarded-for": "x_forwarded_for",
+    b"user-agent": "user_agent",
+    b"referer": "referer",
+    b"content-type": "content_type",
+    b"content-length": "content_length",
+    b"origin": "origin",
+    b"connection": "connection",
+}
+_REQUESTER_FIELDS = ("host", "client_host", *_REQUESTER_HEADERS.values())
+# Severity of loguru's WARNING level, used for error responses.
+_WARNING_NO = 30
 
-class LogAPIRoute(APIRoute):
+
+def _elapsed(started: float) -> str:
+    """
+    Formats the time since `started` as shown in logs and the X-Response-Time header.
+    """
+    return f"{time.perf_counter() - started:.3f}s"
+
+
+def _decode_prefix(data: bytearray, truncated: bool) -> str:
+    """
+    Decodes captured bytes, dropping a character cut in half by the capture limit.
+    """
+    if truncated:
+        return _Utf8Decoder(errors="replace").decode(data, final=False)
+    return data.decode("utf-8", errors="replace")
+
+
+class LoggingASGIMiddleware:
     """
-    Custom route that logs detailed information about each request and response.
+    ASGI middleware that logs detailed information about each request and response.
+
+    Only wraps `receive` and `send`: request and response bodies are copied up to
+    their limits as they stream through, and the log record is built once the
+    response has been sent.
     """
 
     def __init__(
         self,
-        *args,
+        app: ASGIApp,
+        *,
         response_limit: int = 1000,
         body_limit: int = 1000,
         logger_instance=None,
         log_level: str = "INFO",
-        **kwargs,
+        log_bodies: bool = True,
     ):
-        super().__init__(*args, **kwargs)
+        self.app = app
         self.RESPONSE_LIMIT = response_limit
         self.BODY_LIMIT = body_limit
         self.logger = logger_instance or logger
         self.log_level = log_level.upper()
+        self.log_bodies = log_bodies
+        self._level_no = self._resolve_level_no()
+        self._log_fn = self._bind_log_fn()
 
-    def get_route_handler(self) -> Callable:
-        original = super().get_route_handler()
-
-        async def handler(request: Request) -> Response:
-            params, body = await self._extract_request_data(request)
-            started = time.time()
-            try:
-                response = await original(request)
-            except Exception as exc:
-                await self._log_exception(request, exc, started, params, body)
-                raise
-            else:
-                await self._after_route_handler(
-                    request=request,
-                    response=response,
-                    before_time=started,
-                    params=params,
-                    body=body,
-                )
-                return response
-
-        return handler
-
-    async def _log_exception(
-        self,
-        request: Request,
-        error: Exception,
-        before_time: float,
-        params: dict[str, Any],
-        body: Any,
-    ) -> None:
-        duration = time.time() - before_time
-        requester = await self._get_requestor_data(request)
-
-        if isinstance(error, HTTPException):
-            status_code = error.status_code
-            response_text = str(getattr(error, "detail", error))
-        elif isinstance(error, RequestValidationError):
-            status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
-            response_text = "Validation error"
-        else:
-            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-            response_text = str(error)
-
-        log_data = {
-            "url": str(request.url),
-            "method": request.method,
-            "status_code": status_code,
-            "duration": f"{duration:.3f}s",
-            "parameters": params,
-            "body": body if isinstance(body, str) else body,
-            "response": response_text,
-            "requester": requester,
-        }
-        self.logger.warning(log_data)
-
-    async def _extract_request_data(self, request: Request) -> tuple[dict[str, Any], Any]:
+    def _resolve_level_no(self) -> int | None:
         """
-        Extracts request parameters and body.
+        Looks up the severity of the configured level on the logger itself.
+
+        Custom levels registered with loguru carry their own number; levels the
+        logger does not know about yield None so their records are never gated.
         """
         try:
-            params = dict(request.query_params)
-            params.update(request.path_params)
-            body = await self._get_request_body(request)
-        except Exception as error:
-            self.logger.error(f"Error processing request: {error}")
-            params, body = {}, None
-        return params, body
+            return self.logger.level(self.log_level).no
+        except (AttributeError, TypeError, ValueError):
+            return None
 
-    async def _get_request_body(self, request: Request) -> Any:
+    def _bind_log_fn(self) -> Callable[[dict[str, Any]], None]:
         """
-        Gets the request body, handling different content types.
+        Resolves the logger method for the configured level once.
         """
+        method = {
+            "INFO": self.logger.info,
+            "DEBUG": self.logger.debug,
+            "WARNING": self.logger.warning,
+            "ERROR": self.logger.error,
+        }.get(self.log_level)
+        return method or partial(self.logger.log, self.log_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        body = bytearray()
+        body_size = 0
+        response = bytearray()
+        start: Message = {}
+        duration: str | None = None
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_size
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                body_size += len(chunk)
+                if len(body) < self.BODY_LIMIT:
+                    body.extend(chunk[: self.BODY_LIMIT - len(body)])
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal duration
+            if message["type"] == "http.response.start":
+                start.update(message)
+                duration = _elapsed(started)
+                MutableHeaders(scope=message).append("X-Response-Time", duration)
+            elif self.log_bodies and message["type"] == "http.response.body" and len(response) < self.RESPONSE_LIMIT:
+                response.extend(message.get("body", b"")[: self.RESPONSE_LIMIT - len(response)])
+            await send(message)
+
         try:
-            content_type = request.headers.get("content-type", "").split(";")[0]
-            if content_type in (
-                "application/x-www-form-urlencoded",
-                "multipart/form-data",
-            ):
-                return await self._process_form_data(request)
-            elif content_type == "application/json":
-                body = await request.json()
-                return body
-            else:
-                body_bytes = await request.body()
-                return body_bytes.decode("utf-8", errors="replace")
-        except Exception as error:
-            self.logger.warning(f"Error getting request body: {error}")
-            return None
+            await self.app(scope, receive_wrapper if self.log_bodies else receive, send_wrapper)
+        except Exception as exc:
+            self._log(
+                scope,
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                duration=_elapsed(started),
+                body=body,
+                body_size=body_size,
+                response=str(exc)[: self.RESPONSE_LIMIT],
+            )
+            raise
+        else:
+            self._log(
+                scope,
+                start.get("status", status.HTTP_500_INTERNAL_SERVER_ERROR),
+                duration=duration or _elapsed(started),
+                body=body,
+                body_size=body_size,
+                response=response,
+            )
 
-    @staticmethod
-    async def _process_form_data(request: Request) -> dict[str, Any]:
-        """
-        Processes form data from the request.
-        """
-        form_data = await request.form()
-        form_data_dict = {}
-        for key, value in form_data.items():
-            if isinstance(value, UploadFile):
-                form_data_dict[key] = {
-                    "filename": value.filename,
-                    "content_type": value.content_type,
-                    "file_size": value.size,
-                }
-            else:
-                form_data_dict[key] = str(value)
-        return form_data_dict
-
-    async def _after_route_handler(
+    def _log(
         self,
-        request: Request,
-        response: Response,
-        before_time: float,
-        params: dict[str, Any],
-        body: Any,
-    ):
+        scope: Scope,
+        status_code: int,
+        *,
+        duration: str,
+        body: bytearray,
+        body_size: int,
+        response: bytearray | str,
+    ) -> None:
         """
-        Executes actions after route processing, logging request and response details.
+        Logs the request and response details, error responses and exceptions as warnings.
         """
+        is_error = status_code >= status.HTTP_400_BAD_REQUEST
+        if not self._should_log(_WARNING_NO if is_error else self._level_no):
+            return
         try:
-            duration = time.time() - before_time
-            requester = await self._get_requestor_data(request)
-
-            if isinstance(response, Response):
-                if not hasattr(response, "headers") or response.headers is None:
-                    response.headers = {}
-                response.headers["X-Response-Time"] = f"{duration:.3f}s"
+            log_data = self._build_log_data(
+                scope,
+                status_code,
+                duration=duration,
+                body=body,
+                body_size=body_size,
+                log_response=response if isinstance(response, str) else self._get_log_response(response),
+            )
+            (self.logger.warning if is_error else self._log_fn)(log_data)
+        except Exception as error:
+            self.logger.error(f"Error in logging middleware: {error}")
 
-            log_response = self._get_log_response(response)
-            self._log_request(request, response, duration, params, body, log_response, requester)
+    def _should_log(self, level_no: int | None) -> bool:
+        """
+        Checks whether a record at `level_no` would reach any sink.
 
-        except Exception as error:
-            self.logger.error(f"Error in after_route_handler: {error}")
-
-    def _get_log_response(self, response: Response) -> str:
-        """
-        Gets the response content to be logged.
-        """
-        if isinstance(response, Response):
-            content_type = response.media_type or ""
-            if "application/json" in content_type:
-                try:
-                    log_response = json.loads(response.body.decode("utf-8"))
-                    return json.dumps(log_response)[: self.RESPONSE_LIMIT]
-                except Exception as error:
-                    self.logger.error(f"Error processing response: {error}")
-                    return response.body.decode("utf-8", errors="replace")[: self.RESPONSE_LIMIT]
-            else:
-                return response.body.decode("utf-8", errors="replace")[: self.RESPONSE_LIMIT]
-        elif isinstance(response, HTTPException):
-            return str(response.detail)[: self.RESPONSE_LIMIT]
-        else:
-            return str(response)[: self.RESPONSE_LIMIT]
+        Loguru keeps the lowest level accepted by its sinks on its core, so
+        requests it would drop skip building the record. Other loggers and
+        unknown levels decide for themselves and are always called.
+        """
+        core = getattr(self.logger, "_core", None)
+        return core is None or level_no is None or level_no >= core.min_level
 
-    def _log_request(
+    def _build_log_data(
         self,
-        request: Request,
-        response: Response,
-        duration: float,
-        params: dict[str, Any],
-        body: Any,
+        scope: Scope,
+        status_code: int,
+        *,
+        duration: str,
+        body: bytearray,
+        body_size: int,
         log_response: str,
-        requester: dict[str, Any],
-    ):
+    ) -> dict[str, Any]:
         """
-        Logs the request and response details.
+        Builds the log record for a request.
         """
-        log_data = {
-            "url": str(request.url),
-            "method": request.method,
-            "status_code": response.status_code,
-            "duration": f"{duration:.3f}s",
+        requester = self._get_requestor_data(scope)
+        query_string = scope.get("query_string", b"")
+        params = dict(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)) if query_string else {}
+        params.update(scope.get("path_params", {}))
+        request_body = (
+            self._get_request_body(requester["content_type"] or "", body, body_size) if self.log_bodies else None
+        )
+        return {
+            "url": self._get_url(scope, requester["host"], query_string),
+            "method": scope["method"],
+            "status_code": status_code,
+            "duration": duration,
             "parameters": params,
-            "body": body[: self.BODY_LIMIT] if isinstance(body, str) else body,
-            "response": log_response[: self.RESPONSE_LIMIT],
+            "body": request_body,
+            "response": log_response,
             "requester": requester,
         }
-        if self.log_level == "INFO":
-            self.logger.info(log_data)
-        elif self.log_level == "DEBUG":
-            self.logger.debug(log_data)
-        elif self.log_level == "WARNING":
-            self.logger.warning(log_data)
-        elif self.log_level == "ERROR":
-            self.logger.error(log_data)
+
+    @staticmethod
+    def _get_url(scope: Scope, host: str | None, query_string: bytes) -> str:
+        """
+        Gets the request URL, built straight from the Host header when there is one.
+
+        The mount prefix in `root_path` is included unless the server already put
+        it in `path`, and the raw query string is decoded as latin-1 so it never fails.
+        """
+        root_path = scope.get("root_path", "")
+        path = scope["path"] if scope["path"].startswith(root_path) else root_path + scope["path"]
+        if host is None:
+            url = str(URL(scope={**scope, "path": path, "query_string": b""}))
         else:
-            self.logger.log(self.log_level, log_data)
+            url = f"{scope.get('scheme', 'http')}://{host}{path}"
+        return f"{url}?{query_string.decode('latin-1')}" if query_string else url
+
+    def _get_request_body(self, content_type: str, body: bytearray, body_size: int) -> Any:
+        """
+        Gets the captured request body, handling different content types.
+        """
+        try:
+            if content_type.startswith("multipart/form-data"):
+                return {"content_type": "multipart/form-data", "size": body_size}
+            if body_size > self.BODY_LIMIT:
+                kept = _decode_prefix(body, True)
+                return f"{kept}...<+{body_size - len(kept.encode())} bytes omitted>"
+            text = _decode_prefix(body, False)
+            if content_type.startswith("application/x-www-form-urlencoded"):
+                return dict(parse_qsl(text, keep_blank_values=True))
+            if content_type.startswith("application/json"):
+                with suppress(ValueError):
+                    return json.loads(text)
+            return text
+        except Exception as error:
+            self.logger.warning(f"Error getting request body: {error}")
+            return None
+
+    def _get_log_response(self, response: bytearray) -> str:
+        """
+        Gets the captured response content to be logged.
+        """
+        return _decode_prefix(response, len(response) >= self.RESPONSE_LIMIT)
 
     @staticmethod
-    async def _get_requestor_data(request: Request) -> dict[str, Any]:
+    def _get_requestor_data(scope: Scope) -> dict[str, Any]:
         """
         Gets information about the request sender from headers.
+
+        Walks the raw ASGI headers once, keeping the first value of each.
         """
-        headers = request.headers
-        return {
-            "host": headers.get("host"),
-            "client_host": request.client.host if request.client else None,
-            "x_forwarded_for": headers.get("x-forwarded-for"),
-            "user_agent": headers.get("user-agent"),
-            "referer": headers.get("referer"),
-            "content_type": headers.get("content-type", headers.get("accept")),
-            "content_length": headers.get("content-length"),
-            "origin": headers.get("origin"),
-            "connection": headers.get("connection"),
-        }
+        requester: dict[str, Any] = dict.fromkeys(_REQUESTER_FIELDS)
+        client = scope.get("client")
+        requester["client_host"] = client[0] if client else None
+        accept = None
+        for key, value in scope["headers"]:
+            field = _REQUESTER_HEADERS.get(key)
+            if field is not None:
+                if requester[field] is None:
+                    requester[field] = value.decode("latin-1")
+            elif key == b"accept" and accept is None:
+                accept = value.decode("latin-1")
+        if requester["content_type"] is None:
+            requester["content_type"] = accept
+        return requester
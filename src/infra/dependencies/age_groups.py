@@ -5,17 +5,16 @@ from app.usecases.age_group import AgeGroupUseCase
 from infra.repositories.age_group import AgeGroupRepository
 from infra.repositories.enrollment import EnrollmentRepository
 
+_use_case = AgeGroupUseCase(AgeGroupService(repo=AgeGroupRepository(), enrollments=EnrollmentRepository()))
 
-def provide_use_case() -> AgeGroupUseCase:
+
+async def provide_use_case() -> AgeGroupUseCase:
     """Provide age group use case with all dependencies.
 
-    Creates and configures an AgeGroupUseCase with required repositories
-    and services for age group operations.
+    The use case, its services and repositories are built once and shared
+    by all requests, all of them working on the shared database handle.
 
     Returns:
         Configured age group use case
     """
-    age_groups = AgeGroupRepository()
-    enrollments = EnrollmentRepository()
-    service = AgeGroupService(repo=age_groups, enrollments=enrollments)
-    return AgeGroupUseCase(service)
+    return _use_case
@@ -1,25 +1,46 @@
 from __future__ import annotations
 
+from loguru import logger
+
 from app.services.enrollment import EnrollmentService
 from app.usecases.enrollment import EnrollmentUseCase
+from infra.messaging.batching import BatchingPublisher
 from infra.messaging.rabbitmq import RabbitPublisher
 from infra.repositories.age_group import AgeGroupRepository
 from infra.repositories.enrollment import EnrollmentRepository
 
-_publisher = RabbitPublisher()
+_publisher = BatchingPublisher(RabbitPublisher())
+_use_case = EnrollmentUseCase(
+    service=EnrollmentService(age_groups=AgeGroupRepository(), enrollments=EnrollmentRepository()),
+    publisher=_publisher,
+)
 
 
-def provide_use_case() -> EnrollmentUseCase:
+async def provide_use_case() -> EnrollmentUseCase:
     """Provide enrollment use case with all dependencies.
 
-    Creates and configures an EnrollmentUseCase with required repositories,
-    services, and messaging publisher for enrollment operations.
+    The use case, its service, repositories and publisher connection are
+    built once and shared by all requests.
 
     Returns:
         Configured enrollment use case
     """
-    svc = EnrollmentService(
-        age_groups=AgeGroupRepository(),
-        enrollments=EnrollmentRepository(),
-    )
-    return EnrollmentUseCase(service=svc, publisher=_publisher)
+    return _use_case
+
+
+async def connect_publisher() -> None:
+    """Open the shared publisher connection so the first request skips the handshake.
+
+    A broker that is not reachable yet is only logged: the publisher connects
+    again on the next publish.
+    """
+    try:
+        await _publisher.connect()
+    except RuntimeError as exc:
+        logger.warning(f"Publisher warm-up skipped: {exc}")
+
+
+async def close_publisher() -> None:
+    """Publish queued messages and close the shared publisher connection."""
+    await _publisher.flush()
+    _publisher.close()
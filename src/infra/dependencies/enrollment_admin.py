@@ -4,16 +4,16 @@ from app.services.enrollment_admin import EnrollmentAdminService
 from app.usecases.enrollment_admin import EnrollmentAdminUseCase
 from infra.repositories.enrollment import EnrollmentRepository
 
+_use_case = EnrollmentAdminUseCase(EnrollmentAdminService(EnrollmentRepository()))
 
-def provide_admin_use_case() -> EnrollmentAdminUseCase:
+
+async def provide_admin_use_case() -> EnrollmentAdminUseCase:
     """Provide enrollment admin use case with all dependencies.
 
-    Creates and configures an EnrollmentAdminUseCase with required repositories
-    and services for enrollment administrative operations.
+    The use case, its service and repository are built once and shared
+    by all requests, all of them working on the shared database handle.
 
     Returns:
         Configured enrollment admin use case
     """
-    repo = EnrollmentRepository()
-    svc = EnrollmentAdminService(repo)
-    return EnrollmentAdminUseCase(svc)
+    return _use_case
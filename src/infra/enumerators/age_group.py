@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class AgeGroupDeletion(Enum):
+    """Enumeration for the outcomes of deleting an age group.
+
+    Distinguishes a removed group from one that was not found or is still in use.
+    """
+
+    DELETED = "DELETED"
+    MISSING = "MISSING"
+    IN_USE = "IN_USE"
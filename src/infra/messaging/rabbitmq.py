@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import threading
+from collections.abc import Sequence
 from typing import Any
 
 import pika
@@ -10,6 +11,11 @@ from pika.exceptions import AMQPError
 
 from settings import cfg
 
+# Same for every message and never modified by pika, which only encodes it.
+_PROPS = pika.BasicProperties(content_type="application/json", delivery_mode=2)
+# Compact UTF-8 JSON: payloads are flat dicts, so the circular reference check is skipped.
+_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, check_circular=False).encode
+
 
 class RabbitPublisher:
     """RabbitMQ message publisher for enrollment events."""
@@ -43,7 +49,8 @@ class RabbitPublisher:
         """Ensure RabbitMQ channel is open and configured.
 
         Creates new connection and channel if needed, declares queue,
-        and sets up delivery confirmation.
+        and puts the channel in transactional mode, so each batch is
+        confirmed by a single commit.
 
         Returns:
             Active RabbitMQ channel
@@ -54,7 +61,7 @@ class RabbitPublisher:
         conn = pika.BlockingConnection(params)
         ch: BlockingChannel = conn.channel()
         ch.queue_declare(queue=self._queue, durable=True, auto_delete=False)
-        ch.confirm_delivery()
+        ch.tx_select()
         ch.add_on_return_callback(self._on_return)
         self._conn = conn
         self._ch = ch
@@ -73,10 +80,25 @@ class RabbitPublisher:
         self._conn = None
         self._ch = None
 
+    def connect(self) -> None:
+        """Open connection and channel ahead of the first publish.
+
+        Thread-safe; does nothing if the channel is already open.
+
+        Raises:
+            RuntimeError: If the broker cannot be reached
+        """
+        with self._lock:
+            try:
+                self._ensure_channel()
+            except Exception as e:
+                self._reset()
+                raise RuntimeError(f"connect failed: {e!r}") from e
+
     def publish(self, payload: dict[str, Any]) -> None:
         """Publish message to RabbitMQ queue.
 
-        Serializes payload to JSON and publishes with delivery confirmation.
+        Serializes payload to JSON and returns once the broker has committed it.
         Thread-safe operation with automatic connection management.
 
         Args:
@@ -85,19 +107,39 @@ class RabbitPublisher:
         Raises:
             RuntimeError: If message publishing fails or is unroutable
         """
-        body = json.dumps(payload).encode("utf-8")
-        props = pika.BasicProperties(content_type="application/json", delivery_mode=2)
+        self.publish_many([payload])
+
+    def publish_many(self, payloads: Sequence[dict[str, Any]]) -> None:
+        """Publish several messages to RabbitMQ queue in one go.
+
+        Messages are published back to back in one transaction and the method
+        returns once the broker has committed it, so a batch costs one broker
+        round trip instead of one per message. A failed batch is discarded as
+        a whole when the connection is reset, and the broker reports messages
+        it could not route before acknowledging the commit.
+
+        Args:
+            payloads: Message data to publish, in order
+
+        Raises:
+            RuntimeError: If publishing any message fails or is unroutable
+        """
+        bodies = [_encode(payload).encode("utf-8") for payload in payloads]
         with self._lock:
             try:
                 self._unroutable = False
                 ch = self._ensure_channel()
-                ch.basic_publish(
-                    exchange="",
-                    routing_key=self._queue,
-                    body=body,
-                    properties=props,
-                    mandatory=True,
-                )
+                for body in bodies:
+                    ch.basic_publish(
+                        exchange="",
+                        routing_key=self._queue,
+                        body=body,
+                        properties=_PROPS,
+                        mandatory=True,
+                    )
+                ch.tx_commit()
+                # Returns arrive before Commit-Ok; dispatch them to _on_return.
+                ch.connection.process_data_events(time_limit=0)
                 if self._unroutable:
                     raise AMQPError("message was returned (unroutable)")
             except Exception as e:
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from typing import Any
 
 from tinydb.table import Table
 
-from domain.age_group import AgeGroup, AgeRange
+from domain.age_group import AgeGroup, AgeGroupIndex, AgeRange
 from infra.common.database import age_group_table
+from infra.common.database_lock import db_lock
+from infra.enumerators.age_group import AgeGroupDeletion
 from infra.repositories.base import BaseRepository
 
+# Ages answered from the in-memory lookup table; older ages bisect the index.
+_INDEXED_AGES = 121
+
 
 class AgeGroupRepository(BaseRepository[AgeGroup]):
     """Repository for age group data operations."""
@@ -20,7 +25,7 @@ class AgeGroupRepository(BaseRepository[AgeGroup]):
             table: TinyDB table instance (default: from database config)
         """
         super().__init__(
-            table=table or age_group_table,
+            table=table if table is not None else age_group_table,
             factory=self._to_domain,
             dumper=self._to_dict,
         )
@@ -67,28 +72,100 @@ class AgeGroupRepository(BaseRepository[AgeGroup]):
         """
         return self.get_by_fields(name=name)
 
+    def index(self) -> AgeGroupIndex:
+        """Get an index over the stored age groups.
+
+        Cached until the next write to the age groups table and shared between
+        callers; the indexed groups are immutable.
+
+        Returns:
+            Index of the stored age groups
+        """
+        return self._derived("index", lambda: AgeGroupIndex(self._factory(doc) for doc in self.table))
+
+    def exists_by_name(self, name: str) -> bool:
+        """Check if an age group with the given name exists.
+
+        Answered from the cached age group index.
+
+        Args:
+            name: Age group name to check
+
+        Returns:
+            True if the age group exists, False otherwise
+        """
+        return name in self.index().names
+
     def find_overlapping(self, *, min_age: int, max_age: int) -> list[AgeGroup]:
         """Find age groups with overlapping age ranges.
 
+        Answered from the cached age group index by bisection instead of
+        matching every document with a query.
+
         Args:
             min_age: Minimum age of range to check
             max_age: Maximum age of range to check
 
         Returns:
-            List of overlapping age groups
+            List of overlapping age groups, ordered by minimum age
         """
-        return self.search_by_fields(
-            min_age__lte=max_age,
-            max_age__gte=min_age,
-        )
+        return self.index().overlapping(min_age, max_age)
+
+    def _groups_by_age(self) -> list[AgeGroup | None]:
+        """Build a lookup table mapping each indexed age to its covering group.
+
+        Returns:
+            List where position ``age`` holds the covering age group or None
+        """
+        by_age: list[AgeGroup | None] = [None] * _INDEXED_AGES
+        for doc in self.table:
+            group = self._factory(doc)
+            lo = group.age_range.min_age
+            hi = min(group.age_range.max_age, _INDEXED_AGES - 1)
+            if lo <= hi:
+                by_age[lo : hi + 1] = [group] * (hi - lo + 1)
+        return by_age
 
     def find_covering(self, age: int) -> AgeGroup | None:
         """Find age group that covers specific age.
 
+        Common ages are answered from a lookup table cached until the next
+        write to the age groups table, other ages by bisecting the cached
+        age group index. The returned group is shared with the cache, which
+        is safe because age groups are immutable.
+
         Args:
             age: Age to find coverage for
 
         Returns:
             Age group that covers the age, None if not found
         """
-        return self.get_by_fields(min_age__lte=age, max_age__gte=age)
+        if 0 <= age < _INDEXED_AGES:
+            return self._derived("groups_by_age", self._groups_by_age)[age]
+        return next(iter(self.index().overlapping(age, age)), None)
+
+    def warm_up(self) -> None:
+        """Build the cached lookup tables ahead of the first request."""
+        self._derived("groups_by_age", self._groups_by_age)
+        self.index()
+
+    def delete_if_unused(self, name: str, is_used: Callable[[str], bool]) -> AgeGroupDeletion:
+        """Delete age group unless it is missing or still in use.
+
+        The existence check, usage check and removal run under a single lock
+        acquisition, so no enrollment can be approved in between.
+
+        Args:
+            name: Age group name to delete
+            is_used: Function telling whether an age group name is in use
+
+        Returns:
+            Outcome of the deletion
+        """
+        with db_lock:
+            if not self.exists_by_name(name):
+                return AgeGroupDeletion.MISSING
+            if is_used(name):
+                return AgeGroupDeletion.IN_USE
+            self.remove(name=name)
+        return AgeGroupDeletion.DELETED
@@ -1,6 +1,10 @@
-from collections.abc import Callable, Mapping
-from functools import reduce
+import operator
+import os
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache, reduce
+from itertools import islice
 from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
 
 from tinydb import Query
 from tinydb.queries import QueryInstance
@@ -9,6 +13,75 @@ from tinydb.table import Document, Table
 from infra.common.database_lock import db_lock
 
 T = TypeVar("T")
+D = TypeVar("D")
+
+TableVersion = tuple[int, tuple[int, int] | None]
+
+# Per-table write counters and values derived from table content. Keyed by the
+# Table object so that every repository instance sharing a table shares them.
+_write_counts: WeakKeyDictionary[Table, int] = WeakKeyDictionary()
+_derived_cache: WeakKeyDictionary[Table, dict[str, tuple[TableVersion, Any]]] = WeakKeyDictionary()
+# File signature seen right after this process last wrote through each table.
+_written_signatures: WeakKeyDictionary[Table, tuple[int, int] | None] = WeakKeyDictionary()
+
+
+def _storage_signature(table: Table) -> tuple[int, int] | None:
+    """Get modification time and size of the file backing a table.
+
+    Catches writes made by other processes or directly on the table, which
+    the in-process write counter cannot see.
+
+    Args:
+        table: TinyDB table instance
+
+    Returns:
+        Tuple of (mtime in ns, size in bytes), or None for non-file storages
+    """
+    handle = getattr(table.storage, "_handle", None)
+    if handle is None:
+        return None
+    try:
+        stat = os.fstat(handle.fileno())
+    except (OSError, ValueError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+_OPERATORS: dict[str, Callable[[Query, Any], QueryInstance]] = {
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "ne": operator.ne,
+    "in": lambda qf, value: qf.one_of(value),
+    "nin": lambda qf, value: ~qf.one_of(value),
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_shape(keys: tuple[str, ...]) -> Callable[[tuple[Any, ...]], QueryInstance]:
+    """Parse the keys of a query once and return a builder taking only the values.
+
+    Args:
+        keys: Field filters with optional operators (field__op), in call order
+
+    Returns:
+        Function building the query for values given in the same order as `keys`
+
+    Raises:
+        ValueError: If an unsupported operator is used
+    """
+    parts = []
+    for key in keys:
+        field, sep, op = key.partition("__")
+        if sep and op not in _OPERATORS:
+            raise ValueError(f"Unsupported operator: {op}")
+        parts.append((getattr(Query(), field), _OPERATORS[op] if sep else operator.eq))
+
+    def build(values: tuple[Any, ...]) -> QueryInstance:
+        return reduce(operator.and_, [apply(qf, value) for (qf, apply), value in zip(parts, values, strict=True)])
+
+    return build
 
 
 class BaseRepository[T]:
@@ -17,6 +90,10 @@ class BaseRepository[T]:
     Provides common CRUD operations for domain entities using TinyDB storage.
     """
 
+    # Whether converted entities may be handed to several callers, which is
+    # only safe for immutable entities.
+    _share_models = False
+
     def __init__(
         self, table: Table, *, factory: Callable[[Mapping[str, Any]], T], dumper: Callable[[T], dict[str, Any]]
     ):
@@ -32,6 +109,30 @@ class BaseRepository[T]:
         self._dumper = dumper
         self.Query = Query()
 
+    def _converter(self) -> Callable[[Document], T]:
+        """Get a function converting documents into domain entities.
+
+        Repositories of immutable entities (``_share_models``) reuse the
+        entities built since the last write, keyed by document ID. Take the
+        converter before reading the documents, so that a write in between
+        discards whatever it builds from them.
+
+        Returns:
+            Function converting one document
+        """
+        factory = self._factory
+        if not self._share_models:
+            return factory
+        built: dict[int, T] = self._derived("models", dict)
+
+        def convert(doc: Document) -> T:
+            model = built.get(doc.doc_id)
+            if model is None:
+                model = built[doc.doc_id] = factory(doc)
+            return model
+
+        return convert
+
     def _to_model(self, document: Document | None) -> T | None:
         """Convert TinyDB document to domain entity.
 
@@ -45,6 +146,49 @@ class BaseRepository[T]:
             return self._factory(document)
         return None
 
+    @property
+    def version(self) -> TableVersion:
+        """Current version of the underlying table, changed by every write.
+
+        Returns:
+            Opaque comparable version value
+        """
+        return _write_counts.get(self.table, 0), _storage_signature(self.table)
+
+    def _touch(self) -> None:
+        """Mark the underlying table as changed."""
+        _write_counts[self.table] = _write_counts.get(self.table, 0) + 1
+        _written_signatures[self.table] = _storage_signature(self.table)
+
+    def _sync_next_id(self) -> None:
+        """Forget TinyDB's cached next document ID if another handle wrote to the file.
+
+        TinyDB remembers the next ID per table object after the first insert,
+        so once another process (or handle) inserts, this handle would reuse
+        an ID that is already taken. Must be called while holding the lock.
+        """
+        if self.table._next_id is not None and _written_signatures.get(self.table) != _storage_signature(self.table):
+            self.table._next_id = None
+
+    def _derived(self, key: str, build: Callable[[], D]) -> D:
+        """Get a value computed from the table content, rebuilt after writes.
+
+        Args:
+            key: Name of the derived value
+            build: Function computing the value from the current table content
+
+        Returns:
+            Cached value if the table is unchanged, a freshly built one otherwise
+        """
+        version = self.version
+        cache = _derived_cache.setdefault(self.table, {})
+        hit = cache.get(key)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        value = build()
+        cache[key] = (version, value)
+        return value
+
     def _build_query(self, **kwargs) -> QueryInstance:
         """Build TinyDB query from keyword arguments.
 
@@ -59,32 +203,7 @@ class BaseRepository[T]:
         """
         if not kwargs:
             raise ValueError("Cannot build a query with no keyword arguments.")
-
-        def _one(key, value):  # noqa: PLR0911
-            if "__" not in key:
-                return getattr(self.Query, key) == value
-            field, op = key.split("__", 1)
-            qf = getattr(self.Query, field)
-            match op:
-                case "lt":
-                    return qf < value
-                case "lte":
-                    return qf <= value
-                case "gt":
-                    return qf > value
-                case "gte":
-                    return qf >= value
-                case "ne":
-                    return qf != value
-                case "in":
-                    return qf.one_of(value)
-                case "nin":
-                    return ~qf.one_of(value)
-                case _:
-                    raise ValueError(f"Unsupported operator: {op}")
-
-        queries = [_one(k, v) for k, v in kwargs.items()]
-        return queries[0] if len(queries) == 1 else reduce(lambda a, b: a & b, queries)
+        return _compile_shape(tuple(kwargs))(tuple(kwargs.values()))
 
     def insert(self, entity: T) -> T:
         """Insert new entity into database.
@@ -96,9 +215,31 @@ class BaseRepository[T]:
             The inserted entity
         """
         with db_lock:
+            self._sync_next_id()
             self.table.insert(self._dumper(entity))
+            self._touch()
         return entity
 
+    def replace_all(self, entities: Iterable[T]) -> list[T]:
+        """Replace the whole table content with the given entities.
+
+        Truncation and insertion happen under the same lock, so readers never
+        observe a half-populated table.
+
+        Args:
+            entities: Domain entities that become the new table content
+
+        Returns:
+            The inserted entities
+        """
+        items = list(entities)
+        docs = [self._dumper(entity) for entity in items]
+        with db_lock:
+            self.table.truncate()
+            self.table.insert_multiple(docs)
+            self._touch()
+        return items
+
     def get_by_id(self, doc_id: int) -> T | None:
         """Get entity by document ID.
 
@@ -129,6 +270,9 @@ class BaseRepository[T]:
     def get_all(self, offset: int = 0, limit: int = 100) -> list[T]:
         """Get all entities with pagination.
 
+        Only the documents up to the end of the page are wrapped; the rest of
+        the table is never turned into documents.
+
         Args:
             offset: Number of records to skip (default: 0)
             limit: Maximum number of records to return (default: 100)
@@ -136,13 +280,14 @@ class BaseRepository[T]:
         Returns:
             List of domain entities
         """
-        docs = self.table.all()
-        paginated_docs = docs[offset : offset + limit]
-        return [self._factory(doc) for doc in paginated_docs]
+        convert = self._converter()
+        return [convert(doc) for doc in islice(self.table, offset, offset + limit)]
 
     def search_by_fields(self, offset: int = 0, limit: int = 100, **kwargs) -> list[T]:
         """Search entities by field criteria with pagination.
 
+        Matching stops once the page is filled.
+
         Args:
             offset: Number of records to skip (default: 0)
             limit: Maximum number of records to return (default: 100)
@@ -154,9 +299,63 @@ class BaseRepository[T]:
         if not kwargs:
             return self.get_all(offset=offset, limit=limit)
         query = self._build_query(**kwargs)
-        docs = self.table.search(query)
-        paginated_docs = docs[offset : offset + limit]
-        return [self._factory(doc) for doc in paginated_docs]
+        convert = self._converter()
+        matches = (doc for doc in self.table if query(doc))
+        return [convert(doc) for doc in islice(matches, offset, offset + limit)]
+
+    def search_with_total(self, offset: int = 0, limit: int = 100, **kwargs) -> tuple[list[T], int]:
+        """Search entities by field criteria and count all matches in one scan.
+
+        Args:
+            offset: Number of records to skip (default: 0)
+            limit: Maximum number of records to return (default: 100)
+            **kwargs: Field filters to match
+
+        Returns:
+            Tuple of (matching domain entities for the page, total number of matches)
+        """
+        convert = self._converter()
+        if kwargs:
+            docs = self.table.search(self._build_query(**kwargs))
+            return [convert(doc) for doc in docs[offset : offset + limit]], len(docs)
+        items: list[T] = []
+        total = 0
+        for total, doc in enumerate(self.table, 1):
+            if offset < total <= offset + limit:
+                items.append(convert(doc))
+        return items, total
+
+    def search_after(self, *, after: int | None = None, limit: int = 100, **kwargs) -> tuple[list[T], int | None]:
+        """Search entities using keyset pagination on document IDs.
+
+        Unlike offset pagination, skipped rows are never converted and pages
+        stay stable when rows are inserted concurrently.
+
+        Args:
+            after: Document ID of the last entity of the previous page (default: None)
+            limit: Maximum number of records to return (default: 100)
+            **kwargs: Field filters to match
+
+        Returns:
+            Tuple of (matching domain entities, document ID to resume after or None on the last page)
+
+        Raises:
+            ValueError: If limit is not positive
+        """
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        query = self._build_query(**kwargs) if kwargs else None
+        convert = self._converter()
+        docs: list[Document] = []
+        for doc in self.table:
+            if after is not None and doc.doc_id <= after:
+                continue
+            if query is not None and not query(doc):
+                continue
+            if len(docs) == limit:
+                return [convert(d) for d in docs], docs[-1].doc_id
+            docs.append(doc)
+        return [convert(d) for d in docs], None
 
     def update(self, data: dict, **kwargs) -> list[int]:
         """Update entities matching field criteria.
@@ -169,7 +368,9 @@ class BaseRepository[T]:
             List of updated document IDs
         """
         with db_lock:
-            return self.table.update(data, self._build_query(**kwargs))
+            updated = self.table.update(data, self._build_query(**kwargs))
+            self._touch()
+        return updated
 
     def remove(self, **kwargs) -> list[int]:
         """Remove entities matching field criteria.
@@ -181,7 +382,9 @@ class BaseRepository[T]:
             List of removed document IDs
         """
         with db_lock:
-            return self.table.remove(self._build_query(**kwargs))
+            removed = self.table.remove(self._build_query(**kwargs))
+            self._touch()
+        return removed
 
     def exists(self, **kwargs) -> bool:
         """Check if entity exists matching field criteria.
@@ -198,6 +401,8 @@ class BaseRepository[T]:
     def count(self, **kwargs) -> int:
         """Count entities matching field criteria.
 
+        The unfiltered count is cached until the next write to the table.
+
         Args:
             **kwargs: Field filters to match
 
@@ -205,6 +410,6 @@ class BaseRepository[T]:
             Number of matching entities
         """
         if not kwargs:
-            return len(self.table)
+            return self._derived("count", lambda: len(self.table))
         query = self._build_query(**kwargs)
         return self.table.count(query)
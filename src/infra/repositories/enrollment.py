@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections.abc import Mapping
 from typing import Any
 
-from tinydb.table import Table
+from tinydb.table import Document, Table
 
 from domain.enrollment import Enrollment, EnrollmentStatus
 from infra.common.database import enrollment_table
+from infra.common.database_lock import db_lock
 from infra.repositories.base import BaseRepository
 
+# Fields with a per-field index, shared by offset and keyset pagination.
+_INDEXED_FIELDS = frozenset(("name", "age_group_name", "status"))
+
 
 class EnrollmentRepository(BaseRepository[Enrollment]):
     """Repository for enrollment data operations."""
 
+    _share_models = True
+
     def __init__(self, table: Table | None = None):
         """Initialize enrollment repository.
 
@@ -20,7 +27,7 @@ class EnrollmentRepository(BaseRepository[Enrollment]):
             table: TinyDB table instance (default: from database config)
         """
         super().__init__(
-            table=table or enrollment_table,
+            table=table if table is not None else enrollment_table,
             factory=self._to_domain,
             dumper=self._to_dict,
         )
@@ -29,13 +36,15 @@ class EnrollmentRepository(BaseRepository[Enrollment]):
     def _to_domain(data: Mapping[str, Any]) -> Enrollment:
         """Convert database record to enrollment domain entity.
 
+        Records were validated when written, so validation is skipped.
+
         Args:
             data: Database record data
 
         Returns:
             Enrollment domain entity
         """
-        return Enrollment(
+        return Enrollment.from_trusted(
             name=data["name"],
             age=data["age"],
             cpf=data["cpf"],
@@ -65,20 +74,208 @@ class EnrollmentRepository(BaseRepository[Enrollment]):
             "age_group_name": entity.age_group_name,
         }
 
+    def _documents_by_cpf(self) -> dict[str, Document]:
+        """Build a CPF lookup table from the current enrollments.
+
+        Returns:
+            Mapping of CPF to the first enrollment document stored for it
+        """
+        by_cpf: dict[str, Document] = {}
+        for doc in self.table:
+            by_cpf.setdefault(doc["cpf"], doc)
+        return by_cpf
+
     def find_by_cpf(self, cpf: str) -> Enrollment | None:
         """Find enrollment by CPF.
 
+        Served from a CPF lookup table that is rebuilt after any write to the
+        enrollments table, including writes made by the worker process.
+
         Args:
             cpf: CPF to search for
 
         Returns:
             Enrollment if found, None otherwise
         """
-        return self.get_by_fields(cpf=cpf)
+        return self._to_model(self._derived("by_cpf", self._documents_by_cpf).get(cpf))
+
+    def _documents_by(self, field: str) -> dict[Any, list[Document]]:
+        """Group the current enrollments by the value of a field.
+
+        Args:
+            field: Name of the field to group by
+
+        Returns:
+            Mapping of field value to its enrollment documents in table order
+        """
+        groups: dict[Any, list[Document]] = {}
+        for doc in self.table:
+            groups.setdefault(doc.get(field), []).append(doc)
+        return groups
+
+    def _page_by(self, field: str, value: Any, offset: int, limit: int) -> tuple[list[Enrollment], int]:
+        """Get a page of enrollments with an exact field value, with the total count.
+
+        Served from a per-field index rebuilt after any write to the
+        enrollments table, so repeated admin searches do not rescan it.
+
+        Args:
+            field: Name of the field to match
+            value: Field value to match
+            offset: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (enrollments for the page, total number of matches)
+        """
+        convert = self._converter()
+        docs = self._derived(f"by_{field}", lambda: self._documents_by(field)).get(value, [])
+        return [convert(doc) for doc in docs[offset : offset + limit]], len(docs)
+
+    def search_after(
+        self, *, after: int | None = None, limit: int = 100, **kwargs
+    ) -> tuple[list[Enrollment], int | None]:
+        """Search enrollments using keyset pagination on document IDs.
+
+        Filters on a single indexed field bisect into that field's index, so
+        a page costs O(log n + limit) however deep it is. Other filters fall
+        back to scanning the table.
+
+        Args:
+            after: Document ID of the last enrollment of the previous page (default: None)
+            limit: Maximum number of records to return (default: 100)
+            **kwargs: Field filters to match
+
+        Returns:
+            Tuple of (matching enrollments, document ID to resume after or None on the last page)
+
+        Raises:
+            ValueError: If limit is not positive
+        """
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        if len(kwargs) != 1 or not _INDEXED_FIELDS.issuperset(kwargs):
+            return super().search_after(after=after, limit=limit, **kwargs)
+        ((field, value),) = kwargs.items()
+        convert = self._converter()
+        docs = self._derived(f"by_{field}", lambda: self._documents_by(field)).get(value, [])
+        start = 0 if after is None else bisect_right(docs, after, key=lambda doc: doc.doc_id)
+        page = docs[start : start + limit]
+        last = page[-1].doc_id if page and start + limit < len(docs) else None
+        return [convert(doc) for doc in page], last
+
+    def page_by_name(self, name: str, *, offset: int = 0, limit: int = 100) -> tuple[list[Enrollment], int]:
+        """Find enrollments with an exact student name, with the total count.
+
+        Args:
+            name: Student name to match
+            offset: Number of records to skip (default: 0)
+            limit: Maximum number of records to return (default: 100)
+
+        Returns:
+            Tuple of (enrollments for the page, total number of matches)
+        """
+        return self._page_by("name", name, offset, limit)
+
+    def page_by_age_group(self, name: str, *, offset: int = 0, limit: int = 100) -> tuple[list[Enrollment], int]:
+        """Find enrollments in an age group, with the total count.
+
+        Args:
+            name: Age group name to match
+            offset: Number of records to skip (default: 0)
+            limit: Maximum number of records to return (default: 100)
+
+        Returns:
+            Tuple of (enrollments for the page, total number of matches)
+        """
+        return self._page_by("age_group_name", name, offset, limit)
+
+    def page_by_status(
+        self, status: EnrollmentStatus, *, offset: int = 0, limit: int = 100
+    ) -> tuple[list[Enrollment], int]:
+        """Find enrollments with a given status, with the total count.
+
+        Args:
+            status: Enrollment status to match
+            offset: Number of records to skip (default: 0)
+            limit: Maximum number of records to return (default: 100)
+
+        Returns:
+            Tuple of (enrollments for the page, total number of matches)
+        """
+        return self._page_by("status", status.value, offset, limit)
+
+    def upsert_pending(self, entity: Enrollment) -> Enrollment | None:
+        """Store a pending enrollment unless the CPF is already approved.
+
+        Lookup and write happen under a single lock acquisition, so two
+        concurrent requests for the same CPF cannot both insert a record.
+        The existing record is looked up in the cached CPF table, so repeated
+        requests for an already approved CPF are refused without a table scan.
+
+        Args:
+            entity: Pending enrollment to store
+
+        Returns:
+            Enrollment stored for the CPF before the call, or None if there was
+            none. An approved enrollment is left in place.
+        """
+        with db_lock:
+            doc = self._derived("by_cpf", self._documents_by_cpf).get(entity.cpf)
+            previous = self._to_model(doc)
+            if previous is not None and previous.status == EnrollmentStatus.APPROVED:
+                return previous
+            if doc is not None:
+                self.table.update(self._dumper(entity), doc_ids=[doc.doc_id])
+            else:
+                self._sync_next_id()
+                self.table.insert(self._dumper(entity))
+            self._touch()
+        return previous
+
+    def revert_pending(self, entity: Enrollment, previous: Enrollment | None) -> None:
+        """Undo an ``upsert_pending`` whose request was never published.
+
+        The record is only restored while it still holds ``entity``; anything
+        written for the CPF since then is left alone.
+
+        Args:
+            entity: Pending enrollment stored by ``upsert_pending``
+            previous: Enrollment ``upsert_pending`` returned for the CPF
+        """
+        with db_lock:
+            doc = self._derived("by_cpf", self._documents_by_cpf).get(entity.cpf)
+            if doc is None or doc != self._dumper(entity):
+                return
+            if previous is None:
+                self.table.remove(doc_ids=[doc.doc_id])
+            else:
+                self.table.update(self._dumper(previous), doc_ids=[doc.doc_id])
+            self._touch()
+
+    def _age_group_usage(self) -> tuple[frozenset[str], frozenset[str]]:
+        """Collect the age groups referenced by stored enrollments.
+
+        Returns:
+            Tuple of (age groups used by any enrollment, age groups used by approved enrollments)
+        """
+        used: set[str] = set()
+        approved: set[str] = set()
+        for doc in self.table:
+            name = doc.get("age_group_name")
+            if name is None:
+                continue
+            used.add(name)
+            if doc["status"] == EnrollmentStatus.APPROVED.value:
+                approved.add(name)
+        return frozenset(used), frozenset(approved)
 
     def exists_by_age_group(self, name: str, *, only_approved: bool = True) -> bool:
         """Check if enrollments exist for age group.
 
+        Answered from the set of referenced age groups, cached until the next
+        write to the enrollments table.
+
         Args:
             name: Age group name to check
             only_approved: Whether to check only approved enrollments (default: True)
@@ -86,7 +283,10 @@ class EnrollmentRepository(BaseRepository[Enrollment]):
         Returns:
             True if enrollments exist, False otherwise
         """
-        fields: dict[str, Any] = {"age_group_name": name}
-        if only_approved:
-            fields["status"] = EnrollmentStatus.APPROVED.value
-        return self.exists(**fields)
+        used, approved = self._derived("age_group_usage", self._age_group_usage)
+        return name in (approved if only_approved else used)
+
+    def warm_up(self) -> None:
+        """Build the cached lookup tables ahead of the first request."""
+        self._derived("by_cpf", self._documents_by_cpf)
+        self._derived("age_group_usage", self._age_group_usage)
@@ -11,7 +11,9 @@ class EnrollmentCreate(BaseModel):
     model_config = ConfigDict(extra="forbid")
     name: str = Field(..., min_length=3, description="Student's full name (minimum 3 characters)")
     age: Annotated[int, Field(ge=0, description="Student's age in years (must be non-negative)")]
-    cpf: str = Field(..., pattern=r"^\d{3}\.\d{3}\.\d{3}-\d{2}$", description="Brazilian CPF in format XXX.XXX.XXX-XX")
+    cpf: str = Field(
+        ..., pattern=r"^[0-9]{3}\.[0-9]{3}\.[0-9]{3}-[0-9]{2}$", description="Brazilian CPF in format XXX.XXX.XXX-XX"
+    )
 
 
 class Enrollment(BaseModel):
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from infra.enumerators.enrollment import EnrollmentStatus
 
 
 class EnrollmentAdmin(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
     name: str = Field(description="Student's full name")
     age: int = Field(ge=0, description="Student's age in years")
     cpf: str = Field(description="Brazilian CPF document number")
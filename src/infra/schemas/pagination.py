@@ -2,16 +2,23 @@ from pydantic import BaseModel, Field
 
 
 class PageMeta(BaseModel):
-    page: int = Field(description="Current page number (1-based)")
+    page: int | None = Field(description="Current page number (1-based, null when paging by cursor)")
     page_size: int = Field(description="Number of items requested per page")
-    total_items: int = Field(description="Total number of items available across all pages")
-    total_pages: int = Field(description="Total number of pages calculated from total_items / page_size")
+    total_items: int | None = Field(
+        description="Total number of items available across all pages (null when paging by cursor)"
+    )
+    total_pages: int | None = Field(
+        description="Total number of pages calculated from total_items / page_size (null when paging by cursor)"
+    )
 
 
 class PageLink(BaseModel):
     next_page: str | None = Field(description="URL for the next page of results (null if on last page)")
     prev_page: str | None = Field(description="URL for the previous page of results (null if on first page)")
     actual_page: str = Field(description="URL of the current page being displayed")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor to pass as `after` for the next page (null unless paging by cursor)"
+    )
 
 
 class PageResult[T: BaseModel](BaseModel):
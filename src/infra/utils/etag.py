@@ -0,0 +1,50 @@
+import hashlib
+
+from fastapi import Request, Response, status
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def entity_tag(*parts: object) -> str:
+    """Build a strong ETag from the values a response body is made of.
+
+    Args:
+        *parts: Values that fully determine the response body
+
+    Returns:
+        Quoted entity tag
+    """
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode("utf-8"), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def is_fresh(request: Request, etag: str) -> bool:
+    """Check whether the client already holds the representation tagged `etag`.
+
+    Args:
+        request: HTTP request carrying an optional If-None-Match header
+        etag: Entity tag of the current representation
+
+    Returns:
+        True if If-None-Match lists the tag (or "*"), False otherwise
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in tags or "*" in tags
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response for a fresh conditional request.
+
+    Args:
+        etag: Entity tag of the current representation
+
+    Returns:
+        Response with status 304 and the caching headers
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
@@ -1,3 +1,6 @@
+import base64
+import binascii
+from collections.abc import Sequence
 from typing import Any
 from urllib.parse import parse_qsl, urlencode
 
@@ -8,6 +11,40 @@ from pydantic import BaseModel
 from infra.schemas.pagination import PageLink, PageMeta, PageResult
 
 
+def encode_cursor(position: int) -> str:
+    """Encode a keyset position as an opaque URL-safe cursor.
+
+    Args:
+        position: Position of the last item of the current page
+
+    Returns:
+        Opaque cursor string
+    """
+    return base64.urlsafe_b64encode(str(position).encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Position of the last item of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = int(raw.decode("ascii"))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("invalid cursor") from exc
+    if position < 0:
+        raise ValueError("invalid cursor")
+    return position
+
+
 class Pagination[T: BaseModel]:
     """
     Class for creating pagination objects in API responses.
@@ -126,3 +163,34 @@ class Pagination[T: BaseModel]:
                 actual_page=actual_page,
             ),
         )
+
+    @classmethod
+    def create_after(
+        cls,
+        *,
+        request: Request,
+        items: Sequence[Any],
+        page_size: int,
+        next_cursor: str | None,
+        schema_class: type[T],
+    ) -> PageResult[T]:
+        """
+        Builds a page fetched by cursor (keyset pagination).
+
+        Cursor pages have no page number or total; the next page link carries
+        `after=<next_cursor>` in place of `page`, and there is no previous link.
+        """
+        actual_page = str(request.url)
+        base_url, _, query_string = actual_page.partition("?")
+        params = {key: value for key, value in parse_qsl(query_string) if key != "page"}
+        params["page_size"] = str(page_size)
+        next_page = None
+        if next_cursor is not None:
+            params["after"] = next_cursor
+            next_page = f"{base_url}?{urlencode(params)}"
+
+        return PageResult[T](
+            items=[schema_class.model_validate(item) for item in items],
+            meta=PageMeta(page=None, page_size=page_size, total_items=None, total_pages=None),
+            links=PageLink(next_page=next_page, prev_page=None, actual_page=actual_page, next_cursor=next_cursor),
+        )
@@ -9,6 +9,8 @@ import uvicorn
 from infra.api import APIBuilder
 from settings import cfg
 
+_RELOAD_ENVS = frozenset(("dev", "development"))
+
 builder = APIBuilder(cfg)
 builder.build_stack()
 
@@ -18,10 +20,19 @@ app = builder()
 def main() -> None:
     """Start the FastAPI server with uvicorn.
 
-    Runs the enrollment API server on host 0.0.0.0:8003 with
-    hot reload enabled for development.
+    Runs the enrollment API server on host 0.0.0.0:8003 with hot reload in
+    development, and with ``API_WORKERS`` processes in other environments
+    (see that setting for why it defaults to 1).
     """
-    uvicorn.run("main:app", host="0.0.0.0", port=8003, reload=True, access_log=True)
+    reload = cfg.ENVIRONMENT in _RELOAD_ENVS
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8003,
+        reload=reload,
+        workers=None if reload else cfg.API_WORKERS,
+        access_log=True,
+    )
 
 
 if __name__ == "__main__":
@@ -29,6 +29,12 @@ class Config(BaseSettings):
         description="File path for the application's TinyDB database",
     )
     DB_LOCK_TIMEOUT: int = Field(ge=1, default=10, description="Database lock timeout in seconds")
+    API_WORKERS: int = Field(
+        ge=1,
+        default=1,
+        description="Number of API worker processes outside dev; each one also writes to the TinyDB file, "
+        "which is read without a lock, so values above 1 can make reads fail during writes",
+    )
     RABBITMQ_HOST: str = Field(
         default=os.getenv("RABBITMQ_HOST", "localhost"),
         description="RabbitMQ host",
@@ -9,6 +9,7 @@ import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
 from domain.enrollment import Enrollment
+from infra.common.database_lock import db_lock
 from infra.enumerators.enrollment import EnrollmentStatus
 from infra.repositories.age_group import AgeGroupRepository
 from infra.repositories.enrollment import EnrollmentRepository
@@ -76,46 +77,49 @@ def _upsert_final(repo: EnrollmentRepository, age_groups: AgeGroupRepository, pa
     requested_at = int(payload.get("requested_at") or 0)
     group_name = payload.get("age_group_name")
 
-    # Validate prerequisites for approval
-    group_exists = bool(group_name) and age_groups.exists(name=group_name)
     cpf_ok = _cpf_valid(cpf)
 
-    # Determine final status based on validation
-    final_status = EnrollmentStatus.APPROVED if (group_exists and cpf_ok) else EnrollmentStatus.REJECTED
-    enrolled_at = int(time.time()) if final_status == EnrollmentStatus.APPROVED else None
-
-    # Check for existing enrollment
-    existing = repo.find_by_cpf(cpf)
-    ent = Enrollment.create_final(
-        name=name,
-        age=age,
-        cpf=cpf,
-        final_status=final_status,
-        existing=existing,
-        requested_at=requested_at,
-        enrolled_at=enrolled_at,
-        age_group_name=group_name if group_exists else None,
-    )
-
-    # Skip if no changes needed
-    if existing is ent:
-        return
-
-    # Prepare data for persistence
-    data = {
-        "name": ent.name,
-        "age": ent.age,
-        "cpf": ent.cpf,
-        "status": ent.status.value,
-        "requested_at": ent.requested_at,
-        "enrolled_at": ent.enrolled_at,
-        "age_group_name": ent.age_group_name,
-    }
-
-    # Try update first, insert if no existing record
-    updated = repo.update(data, cpf=cpf)
-    if not updated:
-        repo.insert(ent)
+    # The group check and the write share one lock acquisition, so the group
+    # cannot be deleted between approving the enrollment and storing it.
+    with db_lock:
+        group_exists = bool(group_name) and age_groups.exists_by_name(group_name)
+
+        # Determine final status based on validation
+        final_status = EnrollmentStatus.APPROVED if (group_exists and cpf_ok) else EnrollmentStatus.REJECTED
+        enrolled_at = int(time.time()) if final_status == EnrollmentStatus.APPROVED else None
+
+        # Check for existing enrollment
+        existing = repo.find_by_cpf(cpf)
+        ent = Enrollment.create_final(
+            name=name,
+            age=age,
+            cpf=cpf,
+            final_status=final_status,
+            existing=existing,
+            requested_at=requested_at,
+            enrolled_at=enrolled_at,
+            age_group_name=group_name if group_exists else None,
+        )
+
+        # Skip if no changes needed
+        if existing is ent:
+            return
+
+        # Prepare data for persistence
+        data = {
+            "name": ent.name,
+            "age": ent.age,
+            "cpf": ent.cpf,
+            "status": ent.status.value,
+            "requested_at": ent.requested_at,
+            "enrolled_at": ent.enrolled_at,
+            "age_group_name": ent.age_group_name,
+        }
+
+        # Try update first, insert if no existing record
+        updated = repo.update(data, cpf=cpf)
+        if not updated:
+            repo.insert(ent)
 
 
 def _on_message(ch: BlockingChannel, method, _properties, body: bytes) -> None:
@@ -96,8 +96,8 @@ class FakeAgeGroupRepo:
     def __init__(self, names: set[str]):
         self.names = set(names)
 
-    def exists(self, **kwargs) -> bool:
-        return kwargs.get("name") in self.names
+    def exists_by_name(self, name: str) -> bool:
+        return name in self.names
 
 
 class FakeChannel:
@@ -4,6 +4,7 @@ import pytest
 
 from domain.age_group import (
     AgeGroup,
+    AgeGroupIndex,
     AgeGroupOverlapError,
     AgeRange,
     DuplicateAgeGroupError,
@@ -62,3 +63,30 @@ def test_age_range_is_frozen():
     r = AgeRange(0, 10)
     with pytest.raises(FrozenInstanceError):
         r.min_age = 1  # type: ignore
+
+
+def test_index_overlaps_bisects_running_upper_bound():
+    index = AgeGroupIndex([ag("TEEN", 13, 17), ag("SENIOR", 65, 10**20), ag("LONG", 0, 5)])
+    assert index.overlaps(AgeRange(5, 5))
+    assert not index.overlaps(AgeRange(6, 12))
+    assert index.overlaps(AgeRange(18, 65))
+    assert not index.overlaps(AgeRange(18, 64))
+    assert not AgeGroupIndex().overlaps(AgeRange(0, 10**20))
+
+
+def test_create_with_index():
+    index = AgeGroupIndex([ag("ADULT", 18, 59)])
+    with pytest.raises(DuplicateAgeGroupError):
+        AgeGroup.create("ADULT", 0, 17, index)
+    with pytest.raises(AgeGroupOverlapError):
+        AgeGroup.create("YOUNG", 10, 18, index)
+    assert AgeGroup.create("SENIOR", 60, 120, index).name == "SENIOR"
+
+
+def test_index_overlapping():
+    index = AgeGroupIndex([ag("SENIOR", 65, 120), ag("CHILD", 0, 12), ag("TEEN", 13, 17), ag("ADULT", 18, 64)])
+    assert len(index) == 4
+    assert [g.name for g in index.overlapping(10, 20)] == ["CHILD", "TEEN", "ADULT"]
+    assert [g.name for g in index.overlapping(64, 64)] == ["ADULT"]
+    assert index.overlapping(121, 200) == []
+    assert AgeGroupIndex().overlapping(0, 10) == []
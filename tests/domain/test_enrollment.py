@@ -36,6 +36,8 @@ def test_negative_age_raises():
         "123.456.789-000",  # too many digits at end
         "123.456.78-90",  # middle block too short
         "abc.def.ghi-jk",  # letters
+        "١٢٣.456.789-00",  # non-ASCII digits
+        "123.456.789-00\n",  # trailing newline
         "",  # empty
     ],
 )
@@ -168,3 +170,19 @@ def test_create_final_approved_without_enrolled_at_raises():
             enrolled_at=None,  # invalid
             age_group_name="Young",
         )
+
+
+def test_from_trusted_matches_validated_instance_and_stays_frozen():
+    kwargs = {
+        "name": "Eve",
+        "age": 30,
+        "cpf": "441.354.448-06",
+        "status": EnrollmentStatus.APPROVED,
+        "requested_at": 1,
+        "enrolled_at": 2,
+        "age_group_name": "ADULT",
+    }
+    trusted = Enrollment.from_trusted(**kwargs)
+    assert trusted == Enrollment(**kwargs)
+    with pytest.raises(FrozenInstanceError):
+        trusted.age = 31  # type: ignore
@@ -0,0 +1,18 @@
+from starlette.testclient import TestClient
+
+from infra.api import APIBuilder
+from infra.dependencies import enrollment as enrollment_deps
+from settings import cfg
+
+
+def test_lifespan_can_run_twice(monkeypatch):
+    def broker_down():
+        raise RuntimeError("broker down")
+
+    monkeypatch.setattr(enrollment_deps._publisher._inner, "connect", broker_down)
+    builder = APIBuilder(cfg)
+    builder.build_stack()
+
+    for _ in range(2):
+        with TestClient(builder()) as client:
+            assert client.get("/health").status_code == 200
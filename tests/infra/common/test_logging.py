@@ -2,11 +2,11 @@ import json
 
 import pytest
 from fastapi import Body, FastAPI, File, Form, HTTPException, Response, UploadFile, status
-from fastapi.routing import APIRouter
+from loguru import logger
 from pydantic import BaseModel
 from starlette.testclient import TestClient
 
-from infra.common.logging import LogAPIRoute
+from infra.common.logging import LoggingASGIMiddleware
 
 
 class _MemLogger:
@@ -29,101 +29,62 @@ class _MemLogger:
         self.records.append(("custom", _args, _kwargs))
 
 
-class _RouteBase(LogAPIRoute):
-    _logger = _MemLogger()
-
-    def __init__(self, *args, **kwargs):
-        kwargs.setdefault("logger_instance", self._logger)
-        super().__init__(*args, **kwargs)
-
-
-class _RouteInfo(_RouteBase):
-    pass
-
-
-class _RouteDebug(_RouteBase):
-    def __init__(self, *args, **kwargs):
-        kwargs.setdefault("logger_instance", self._logger)
-        kwargs.setdefault("log_level", "DEBUG")
-        super().__init__(*args, **kwargs)
-
-
-class _RouteWarning(_RouteBase):
-    def __init__(self, *args, **kwargs):
-        kwargs.setdefault("logger_instance", self._logger)
-        kwargs.setdefault("log_level", "WARNING")
-        super().__init__(*args, **kwargs)
-
-
-class _RouteError(_RouteBase):
-    def __init__(self, *args, **kwargs):
-        kwargs.setdefault("logger_instance", self._logger)
-        kwargs.setdefault("log_level", "ERROR")
-        super().__init__(*args, **kwargs)
-
-
-class _RouteCustom(_RouteBase):
-    def __init__(self, *args, **kwargs):
-        kwargs.setdefault("logger_instance", self._logger)
-        kwargs.setdefault("log_level", "NOTICE")
-        super().__init__(*args, **kwargs)
-
-
-class _RouteTrunc(_RouteBase):
-    def __init__(self, *args, **kwargs):
-        kwargs.setdefault("logger_instance", self._logger)
-        kwargs.setdefault("response_limit", 5)
-        kwargs.setdefault("body_limit", 5)
-        super().__init__(*args, **kwargs)
+def _app(logger, **kwargs) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(LoggingASGIMiddleware, logger_instance=logger, **kwargs)
+    return app
 
 
 @pytest.fixture
 def client_and_logger():
-    app = FastAPI()
-    router = APIRouter(route_class=_RouteInfo)
+    log = _MemLogger()
+    app = _app(log)
 
     class Item(BaseModel):
         x: int
         y: str
 
-    @router.post("/json")
+    @app.post("/json")
     def json_ep(item: Item):
         return {"ok": True, "sum": item.x, "y": item.y}
 
-    @router.post("/form")
+    @app.get("/items/{item_id}")
+    def item_ep(item_id: int, q: str | None = None):
+        return {"id": item_id, "q": q}
+
+    @app.post("/form")
     def form_ep(a: str = Form(...), b: str = Form(...)):
         return {"a": a, "b": b}
 
-    @router.post("/text")
+    @app.post("/text")
     def text_ep(body: str = Body(..., media_type="text/plain")):
         return {"len": len(body)}
 
-    @router.post("/file")
+    @app.post("/file")
     def file_ep(file: UploadFile = File(...)):  # noqa: B008
         return {"fn": file.filename, "ct": file.content_type}
 
-    @router.get("/boom")
+    @app.get("/boom")
     def boom():
         raise HTTPException(status_code=418, detail="teapot")
 
-    @router.get("/raw-json-bad")
+    @app.get("/raw-json-bad")
     def raw_json_bad():
         return Response(content="not-json", media_type="application/json")
 
-    @router.get("/raw-text")
+    @app.get("/raw-text")
     def raw_text():
         return Response(content="hello", media_type="text/plain")
 
-    app.include_router(router)
-    return TestClient(app), _RouteInfo._logger
+    return TestClient(app), log
 
 
 def test_json_request_logs_and_header(client_and_logger):
     client, log = client_and_logger
-    log.records.clear()
     r = client.post("/json", json={"x": 7, "y": "abc"})
     assert r.status_code == 200 and "X-Response-Time" in r.headers
     rec = next(x for x in log.records if isinstance(x, dict))
+    assert rec["duration"] == r.headers["X-Response-Time"]
     assert rec["status_code"] == 200 and rec["method"] == "POST" and rec["parameters"] == {}
     body = rec["body"]
     assert isinstance(body, dict) and body["x"] == 7 and body["y"] == "abc"
@@ -131,9 +92,48 @@ def test_json_request_logs_and_header(client_and_logger):
     assert resp["ok"] is True and resp["sum"] == 7
 
 
+def test_query_and_path_params_are_logged(client_and_logger):
+    client, log = client_and_logger
+    r = client.get("/items/3?q=abc", headers={"user-agent": "tests"})
+    assert r.status_code == 200
+    rec = next(x for x in log.records if isinstance(x, dict))
+    assert rec["parameters"] == {"q": "abc", "item_id": "3"}
+    assert rec["url"].endswith("/items/3?q=abc")
+    assert rec["requester"]["user_agent"] == "tests"
+
+
+def test_requester_takes_first_header_value_and_falls_back_to_accept():
+    scope = {
+        "client": ("10.0.0.1", 1234),
+        "headers": [
+            (b"user-agent", b"first"),
+            (b"accept", b"application/json"),
+            (b"user-agent", b"second"),
+        ],
+    }
+    requester = LoggingASGIMiddleware._get_requestor_data(scope)
+    assert requester["client_host"] == "10.0.0.1"
+    assert requester["user_agent"] == "first"
+    assert requester["content_type"] == "application/json"
+    assert requester["host"] is None
+
+
+def test_url_falls_back_to_server_without_host_header():
+    scope = {"scheme": "http", "server": ("api", 8003), "path": "/x", "query_string": b"a=1", "headers": []}
+    assert LoggingASGIMiddleware._get_url(scope, None, b"a=1") == "http://api:8003/x?a=1"
+    assert LoggingASGIMiddleware._get_url(scope, "example.com", b"a=1") == "http://example.com/x?a=1"
+
+
+def test_url_includes_root_path_and_tolerates_raw_query_bytes():
+    scope = {"scheme": "http", "server": ("api", 8003), "root_path": "/api", "path": "/x", "headers": []}
+    assert LoggingASGIMiddleware._get_url(scope, "example.com", b"q=\xff") == "http://example.com/api/x?q=\xff"
+    assert LoggingASGIMiddleware._get_url(scope, None, b"q=\xff") == "http://api:8003/api/x?q=\xff"
+    mounted = {**scope, "path": "/api/x"}
+    assert LoggingASGIMiddleware._get_url(mounted, "example.com", b"") == "http://example.com/api/x"
+
+
 def test_urlencoded_form_is_captured(client_and_logger):
     client, log = client_and_logger
-    log.records.clear()
     r = client.post("/form", data={"a": "1", "b": "2"})
     assert r.status_code == 200
     rec = next(x for x in log.records if isinstance(x, dict))
@@ -142,7 +142,6 @@ def test_urlencoded_form_is_captured(client_and_logger):
 
 def test_plain_text_is_captured_as_string(client_and_logger):
     client, log = client_and_logger
-    log.records.clear()
     r = client.post("/text", content="hello world", headers={"content-type": "text/plain"})
     assert r.status_code == 200
     rec = next(x for x in log.records if isinstance(x, dict))
@@ -150,169 +149,207 @@ def test_plain_text_is_captured_as_string(client_and_logger):
     assert rec["body"] == "hello world"
 
 
-def test_file_upload_branch_in_form_processing(client_and_logger):
+def test_multipart_body_is_summarised(client_and_logger):
     client, log = client_and_logger
-    log.records.clear()
     files = {"file": ("hello.txt", b"abc", "text/plain")}
     r = client.post("/file", files=files)
     assert r.status_code == 200
     rec = next(x for x in log.records if isinstance(x, dict))
-    f = rec["body"]["file"]
-    assert f["filename"] == "hello.txt" and f["content_type"] == "text/plain" and f["file_size"] >= 0
+    assert rec["body"]["content_type"] == "multipart/form-data"
+    assert rec["body"]["size"] == int(rec["requester"]["content_length"])
 
 
-def test_http_exception_is_logged_and_raised(client_and_logger):
+def test_http_exception_is_logged_as_warning(client_and_logger):
     client, log = client_and_logger
-    log.records.clear()
     r = client.get("/boom")
     assert r.status_code == 418
     rec = next(x for x in log.records if isinstance(x, dict))
     assert rec["status_code"] == 418 and "teapot" in rec["response"]
 
 
-def test_pydantic_validation_error_is_mapped_and_logged(client_and_logger):
+def test_pydantic_validation_error_is_logged(client_and_logger):
     client, log = client_and_logger
-    log.records.clear()
     r = client.post("/json", json={"x": "NaN", "y": 1})
     assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     rec = next(x for x in log.records if isinstance(x, dict))
     assert rec["status_code"] == 422
 
 
-def test_invalid_json_triggers_422_and_warning(client_and_logger):
+def test_invalid_json_is_logged_as_text(client_and_logger):
     client, log = client_and_logger
-    log.records.clear()
     r = client.post("/json", content="{not valid json", headers={"content-type": "application/json"})
     assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-    assert any(isinstance(x, dict) and x.get("status_code") == 422 for x in log.records)
+    rec = next(x for x in log.records if isinstance(x, dict))
+    assert rec["status_code"] == 422 and rec["body"] == "{not valid json"
 
 
 def test_generic_exception_maps_to_500_and_is_logged():
-    app = FastAPI()
-    router = APIRouter(route_class=_RouteInfo)
+    log = _MemLogger()
+    app = _app(log)
 
-    @router.get("/oops")
+    @app.get("/oops")
     def oops():
         raise RuntimeError("boom")
 
-    app.include_router(router)
     client = TestClient(app, raise_server_exceptions=False)
-    _RouteInfo._logger.records.clear()
     r = client.get("/oops")
     assert r.status_code == 500
-    rec = next(x for x in _RouteInfo._logger.records if isinstance(x, dict))
+    rec = next(x for x in log.records if isinstance(x, dict))
     assert rec["status_code"] == 500 and "boom" in rec["response"]
 
 
-def test_after_route_handler_error_logging(monkeypatch, client_and_logger):
+def test_logging_failure_does_not_break_response(monkeypatch, client_and_logger):
     client, log = client_and_logger
-    log.records.clear()
 
     def _explode(*_a, **_k):
         raise RuntimeError("whoops")
 
-    monkeypatch.setattr(_RouteInfo, "_get_requestor_data", staticmethod(_explode))
+    monkeypatch.setattr(LoggingASGIMiddleware, "_get_requestor_data", staticmethod(_explode))
     r = client.post("/json", json={"x": 1, "y": "a"})
     assert r.status_code == 200
-    assert any(isinstance(x, str) and "Error in after_route_handler" in x for x in log.records)
+    assert any(isinstance(x, str) and "Error in logging middleware" in x for x in log.records)
 
 
-def test_extract_request_data_outer_exception(monkeypatch):
-    app = FastAPI()
-    router = APIRouter(route_class=_RouteInfo)
-
-    @router.post("/txt")
-    def txt(body: str = Body(..., media_type="text/plain")):
-        return {"ok": True}
-
-    def boom(self, request):
-        raise RuntimeError("explode in extractor")
+def test_request_body_error_is_logged(monkeypatch, client_and_logger):
+    client, log = client_and_logger
 
-    monkeypatch.setattr(_RouteInfo, "_get_request_body", boom, raising=True)
+    def _explode(*_a, **_k):
+        raise RuntimeError("explode in decoder")
 
-    app.include_router(router)
-    client = TestClient(app)
-    _RouteInfo._logger.records.clear()
-    r = client.post("/txt", content="x", headers={"content-type": "text/plain"})
+    monkeypatch.setattr("infra.common.logging.parse_qsl", _explode)
+    r = client.post("/form", data={"a": "1", "b": "2"})
     assert r.status_code == 200
-    assert any(isinstance(x, str) and "Error processing request:" in x for x in _RouteInfo._logger.records)
+    assert any(isinstance(x, str) and "Error getting request body:" in x for x in log.records)
+    rec = next(x for x in log.records if isinstance(x, dict))
+    assert rec["body"] is None
 
 
-def test_get_log_response_json_error_fallback(client_and_logger):
+def test_non_json_response_body_is_logged_verbatim(client_and_logger):
     client, log = client_and_logger
-    log.records.clear()
     r = client.get("/raw-json-bad")
     assert r.status_code == 200
     rec = next(x for x in log.records if isinstance(x, dict))
     assert rec["status_code"] == 200 and rec["response"] == "not-json"
 
 
-def test_get_log_response_plain_text_branch(client_and_logger):
+def test_plain_text_response_is_logged(client_and_logger):
     client, log = client_and_logger
-    log.records.clear()
     r = client.get("/raw-text")
     assert r.status_code == 200
     rec = next(x for x in log.records if isinstance(x, dict))
     assert rec["status_code"] == 200 and rec["response"] == "hello"
 
 
-def test_log_levels_debug_warning_error_and_custom():
-    app = FastAPI()
-    dbg = APIRouter(route_class=_RouteDebug)
-    wrn = APIRouter(route_class=_RouteWarning)
-    err = APIRouter(route_class=_RouteError)
-    cst = APIRouter(route_class=_RouteCustom)
+@pytest.mark.parametrize("level", ["DEBUG", "WARNING", "ERROR"])
+def test_log_levels(level):
+    log = _MemLogger()
+    app = _app(log, log_level=level)
 
-    @dbg.get("/dbg")
-    def _dbg():
+    @app.get("/ok")
+    def ok():
         return {"ok": True}
 
-    @wrn.get("/wrn")
-    def _wrn():
-        return {"ok": True}
+    assert TestClient(app).get("/ok").status_code == 200
+    assert any(isinstance(x, dict) for x in log.records)
 
-    @err.get("/err")
-    def _err():
-        return {"ok": True}
 
-    @cst.get("/cst")
-    def _cst():
+def test_custom_log_level():
+    log = _MemLogger()
+    app = _app(log, log_level="notice")
+
+    @app.get("/ok")
+    def ok():
         return {"ok": True}
 
-    app.include_router(dbg)
-    app.include_router(wrn)
-    app.include_router(err)
-    app.include_router(cst)
-    client = TestClient(app)
-    _RouteDebug._logger.records.clear()
-    _RouteWarning._logger.records.clear()
-    _RouteError._logger.records.clear()
-    _RouteCustom._logger.records.clear()
+    assert TestClient(app).get("/ok").status_code == 200
+    assert any(isinstance(x, tuple) and x[0] == "custom" and x[1][0] == "NOTICE" for x in log.records)
+
 
-    assert client.get("/dbg").status_code == 200
-    assert client.get("/wrn").status_code == 200
-    assert client.get("/err").status_code == 200
-    assert client.get("/cst").status_code == 200
+def test_custom_loguru_level_reaches_sink():
+    try:
+        logger.level("AUDIT", no=22)
+    except (TypeError, ValueError):
+        pass
+    records: list = []
+    sink_id = logger.add(records.append, level="AUDIT", format="{level.name}")
+    try:
+        app = _app(logger, log_level="audit")
 
-    assert any(isinstance(x, dict) for x in _RouteDebug._logger.records)
-    assert any(isinstance(x, dict) for x in _RouteWarning._logger.records)
-    assert any(isinstance(x, dict) for x in _RouteError._logger.records)
-    assert any(isinstance(x, tuple) and x[0] == "custom" for x in _RouteCustom._logger.records)
+        @app.get("/ok")
+        def ok():
+            return {"ok": True}
+
+        assert TestClient(app).get("/ok").status_code == 200
+    finally:
+        logger.remove(sink_id)
+    assert any(str(r).startswith("AUDIT") for r in records)
 
 
 def test_truncation_of_body_and_response():
-    app = FastAPI()
-    router = APIRouter(route_class=_RouteTrunc)
+    log = _MemLogger()
+    app = _app(log, response_limit=5, body_limit=5)
 
-    @router.post("/echo")
+    @app.post("/echo")
     def echo(body: str = Body(..., media_type="text/plain")):
         return Response(content="X" * 20, media_type="text/plain")
 
-    app.include_router(router)
-    client = TestClient(app)
-    _RouteTrunc._logger.records.clear()
-    r = client.post("/echo", content="Y" * 20, headers={"content-type": "text/plain"})
-    assert r.status_code == 200
-    rec = next(x for x in _RouteTrunc._logger.records if isinstance(x, dict))
-    assert rec["body"] == "Y" * 5
+    r = TestClient(app).post("/echo", content="Y" * 20, headers={"content-type": "text/plain"})
+    assert r.status_code == 200 and r.text == "X" * 20
+    rec = next(x for x in log.records if isinstance(x, dict))
+    assert rec["body"] == "Y" * 5 + "...<+15 bytes omitted>"
     assert rec["response"] == "X" * 5
+
+
+def test_truncation_keeps_whole_characters():
+    log = _MemLogger()
+    app = _app(log, response_limit=5, body_limit=5)
+
+    @app.post("/echo")
+    def echo(body: str = Body(..., media_type="text/plain")):
+        return Response(content="é" * 10, media_type="text/plain")
+
+    r = TestClient(app).post("/echo", content="ã" * 10, headers={"content-type": "text/plain"})
+    assert r.status_code == 200
+    rec = next(x for x in log.records if isinstance(x, dict))
+    assert rec["body"] == "ãã...<+16 bytes omitted>"
+    assert rec["response"] == "éé"
+
+
+def test_records_below_the_sink_level_are_skipped():
+    log = _MemLogger()
+    log._core = type("_Core", (), {"min_level": 30})()
+    log.level = lambda _name: type("_Level", (), {"no": 20})()
+    app = _app(log)
+
+    @app.get("/ok")
+    def ok():
+        return {"ok": True}
+
+    client = TestClient(app)
+    assert client.get("/ok").status_code == 200
+    assert log.records == []
+    assert client.get("/missing").status_code == 404
+    assert [x["status_code"] for x in log.records] == [404]
+
+
+def test_bodies_are_not_captured_when_disabled():
+    log = _MemLogger()
+    app = _app(log, log_bodies=False)
+
+    @app.post("/echo")
+    def echo(body: str = Body(..., media_type="text/plain")):
+        return Response(content=body, media_type="text/plain")
+
+    r = TestClient(app).post("/echo", content="hello", headers={"content-type": "text/plain"})
+    assert r.text == "hello"
+    rec = next(x for x in log.records if isinstance(x, dict))
+    assert rec["body"] is None and rec["response"] == ""
+
+
+def test_non_http_scopes_pass_through():
+    log = _MemLogger()
+    app = _app(log)
+
+    with TestClient(app):
+        pass
+    assert log.records == []
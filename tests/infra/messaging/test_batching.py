@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Sequence
+
+from infra.messaging.batching import BatchingPublisher
+
+
+class FakeInner:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.batches: list[list[dict]] = []
+        self.fail = fail
+        self.closed = False
+        self.connected = False
+        self.release = threading.Event()
+        self.release.set()
+
+    def connect(self) -> None:
+        self.connected = True
+
+    def publish_many(self, payloads: Sequence[dict]) -> None:
+        self.release.wait(timeout=5)
+        self.batches.append(list(payloads))
+        if self.fail:
+            raise RuntimeError("publish failed: boom")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_concurrent_publishes_share_a_batch():
+    inner = FakeInner()
+    pub = BatchingPublisher(inner)
+
+    async def run():
+        inner.release.clear()
+        first = asyncio.create_task(pub.publish({"n": 0}))
+        await asyncio.sleep(0.01)
+        rest = [asyncio.create_task(pub.publish({"n": i})) for i in range(1, 4)]
+        await asyncio.sleep(0)
+        inner.release.set()
+        await asyncio.gather(first, *rest)
+
+    asyncio.run(run())
+    assert inner.batches == [[{"n": 0}], [{"n": 1}, {"n": 2}, {"n": 3}]]
+
+
+def test_max_batch_splits_batches():
+    inner = FakeInner()
+    pub = BatchingPublisher(inner, max_batch=2)
+
+    async def run():
+        await asyncio.gather(*(pub.publish({"n": i}) for i in range(5)))
+
+    asyncio.run(run())
+    assert [len(b) for b in inner.batches] == [2, 2, 1]
+
+
+def test_batch_failure_reaches_every_caller():
+    inner = FakeInner(fail=True)
+    pub = BatchingPublisher(inner)
+
+    async def run():
+        return await asyncio.gather(*(pub.publish({"n": i}) for i in range(3)), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_connect_flush_and_close():
+    inner = FakeInner()
+    pub = BatchingPublisher(inner)
+
+    async def run():
+        await pub.connect()
+        task = asyncio.create_task(pub.publish({"x": 1}))
+        await asyncio.sleep(0)
+        await pub.flush()
+        assert task.done()
+
+    asyncio.run(run())
+    pub.close()
+    assert inner.connected is True
+    assert inner.closed is True
+
+
+def test_full_backlog_is_refused():
+    inner = FakeInner()
+    pub = BatchingPublisher(inner, max_batch=1, max_pending=2)
+
+    async def run():
+        inner.release.clear()
+        first = asyncio.create_task(pub.publish({"n": 0}))
+        await asyncio.sleep(0.01)
+        queued = [asyncio.create_task(pub.publish({"n": i})) for i in (1, 2)]
+        await asyncio.sleep(0)
+        refused = await asyncio.gather(pub.publish({"n": 3}), return_exceptions=True)
+        inner.release.set()
+        await asyncio.gather(first, *queued)
+        return refused
+
+    (refused,) = asyncio.run(run())
+    assert isinstance(refused, RuntimeError)
+    assert [b[0]["n"] for b in inner.batches] == [0, 1, 2]
@@ -1,5 +1,15 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+from tinydb import TinyDB
+from tinydb.storages import MemoryStorage
+
 from domain.age_group import AgeGroup, AgeRange
+from domain.enrollment import Enrollment
+from infra.enumerators.age_group import AgeGroupDeletion
+from infra.enumerators.enrollment import EnrollmentStatus
 from infra.repositories.age_group import AgeGroupRepository
+from infra.repositories.enrollment import EnrollmentRepository
 
 
 def test_age_group_repo(tmp_db):
@@ -33,3 +43,91 @@ def test_age_group_repo(tmp_db):
     repo.remove(name="Child")
     repo.remove(name="Senior")
     assert repo.count() == 0
+
+
+def test_delete_if_unused():
+    db = TinyDB(storage=MemoryStorage)
+    repo = AgeGroupRepository(table=db.table("age_groups"))
+    enrollments = EnrollmentRepository(table=db.table("enrollments"))
+
+    repo.insert(AgeGroup(name="Child", age_range=AgeRange(0, 12)))
+    repo.insert(AgeGroup(name="Adult", age_range=AgeRange(18, 64)))
+    enrollments.insert(
+        Enrollment(
+            name="Maria",
+            age=30,
+            cpf="123.456.789-09",
+            status=EnrollmentStatus.APPROVED,
+            enrolled_at=1,
+            age_group_name="Adult",
+        )
+    )
+
+    def is_used(name: str) -> bool:
+        return enrollments.exists_by_age_group(name, only_approved=True)
+
+    assert repo.delete_if_unused("Missing", is_used) is AgeGroupDeletion.MISSING
+    assert repo.delete_if_unused("Adult", is_used) is AgeGroupDeletion.IN_USE
+    assert repo.delete_if_unused("Child", is_used) is AgeGroupDeletion.DELETED
+    assert repo.exists(name="Adult")
+    assert not repo.exists(name="Child")
+
+
+def test_index():
+    db = TinyDB(storage=MemoryStorage)
+    repo = AgeGroupRepository(table=db.table("age_groups"))
+    repo.insert(AgeGroup(name="Child", age_range=AgeRange(0, 12)))
+
+    index = repo.index()
+    assert "Child" in index.names and "Teen" not in index.names
+    assert not index.overlaps(AgeRange(13, 17))
+    assert index.overlaps(AgeRange(10, 15))
+
+
+def test_find_covering_follows_writes():
+    db = TinyDB(storage=MemoryStorage)
+    repo = AgeGroupRepository(table=db.table("age_groups"))
+    repo.insert(AgeGroup(name="Child", age_range=AgeRange(0, 12)))
+    repo.insert(AgeGroup(name="Senior", age_range=AgeRange(65, 200)))
+
+    child = repo.find_covering(5)
+    assert child is not None and child.name == "Child"
+    assert repo.find_covering(30) is None
+    senior = repo.find_covering(150)
+    assert senior is not None and senior.name == "Senior"
+    assert repo.find_covering(201) is None
+
+    repo.insert(AgeGroup(name="Adult", age_range=AgeRange(18, 64)))
+    adult = repo.find_covering(30)
+    assert adult is not None and adult.name == "Adult"
+
+    repo.remove(name="Child")
+    assert repo.find_covering(5) is None
+
+
+def test_cached_groups_cannot_be_mutated():
+    db = TinyDB(storage=MemoryStorage)
+    repo = AgeGroupRepository(table=db.table("age_groups"))
+    repo.insert(AgeGroup(name="Child", age_range=AgeRange(0, 12)))
+
+    child = repo.find_covering(5)
+    assert child is not None
+    with pytest.raises(FrozenInstanceError):
+        child.age_range = AgeRange(0, 99)  # type: ignore[misc]
+    assert repo.find_covering(50) is None
+    assert repo.index().overlapping(5, 5) == [child]
+
+
+def test_find_overlapping_and_exists_by_name():
+    db = TinyDB(storage=MemoryStorage)
+    repo = AgeGroupRepository(table=db.table("age_groups"))
+    repo.insert(AgeGroup(name="Child", age_range=AgeRange(0, 12)))
+    repo.insert(AgeGroup(name="Teen", age_range=AgeRange(13, 17)))
+
+    assert [g.name for g in repo.find_overlapping(min_age=10, max_age=13)] == ["Child", "Teen"]
+    assert repo.find_overlapping(min_age=18, max_age=30) == []
+    assert repo.exists_by_name("Teen") and not repo.exists_by_name("Adult")
+
+    repo.insert(AgeGroup(name="Adult", age_range=AgeRange(18, 64)))
+    assert [g.name for g in repo.find_overlapping(min_age=18, max_age=30)] == ["Adult"]
+    assert repo.exists_by_name("Adult")
@@ -108,3 +108,78 @@ def test_remove_by_field(repo):
     removed_ids = repo.remove(name="carol")
     assert len(removed_ids) == 1
     assert repo.exists(name="carol") is False
+
+
+def test_replace_all(repo):
+    seed(repo)
+    repo.replace_all([Row("zed", 50, [])])
+    assert repo.count() == 1
+    assert repo.exists(name="zed") is True
+    assert repo.exists(name="alice") is False
+
+
+def test_version_changes_on_write(repo):
+    before = repo.version
+    repo.insert(Row("alice", 20, []))
+    after_insert = repo.version
+    repo.update({"age": 21}, name="alice")
+    after_update = repo.version
+    repo.remove(name="alice")
+    assert len({before, after_insert, after_update, repo.version}) == 4
+
+
+def test_derived_rebuilt_after_write(repo):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return repo.count()
+
+    seed(repo)
+    assert repo._derived("total", build) == 4
+    assert repo._derived("total", build) == 4
+    assert len(calls) == 1
+
+    repo.replace_all([])
+    assert repo._derived("total", build) == 0
+    assert len(calls) == 2
+
+
+def test_search_after(repo):
+    seed(repo)
+    page, cursor = repo.search_after(limit=2)
+    assert [r.name for r in page] == ["alice", "bob"]
+    assert cursor is not None
+    page, cursor = repo.search_after(after=cursor, limit=2)
+    assert [r.name for r in page] == ["carol", "dave"]
+    assert cursor is None
+    page, cursor = repo.search_after(limit=5, age=30)
+    assert [r.name for r in page] == ["bob", "dave"]
+    assert cursor is None
+    with pytest.raises(ValueError, match="limit must be positive"):
+        repo.search_after(limit=0)
+
+
+def test_search_with_total(repo):
+    seed(repo)
+    page, total = repo.search_with_total(offset=1, limit=1, age=30)
+    assert [r.name for r in page] == ["dave"] and total == 2
+    page, total = repo.search_with_total(limit=2)
+    assert [r.name for r in page] == ["alice", "bob"] and total == 4
+
+
+def test_count_all_cached_until_write(repo):
+    seed(repo)
+    assert repo.count() == 4
+    repo.remove(name="bob")
+    assert repo.count() == 3
+    repo.replace_all([])
+    assert repo.count() == 0
+
+
+def test_query_shape_reused_with_new_values(repo):
+    seed(repo)
+    assert [r.name for r in repo.search_by_fields(age__gte=30, tags__nin=[["b"]])] == ["carol", "dave"]
+    assert [r.name for r in repo.search_by_fields(age__gte=40, tags__nin=[["b"]])] == ["carol"]
+    with pytest.raises(ValueError, match="Unsupported operator: like"):
+        repo.exists(name__like="a")
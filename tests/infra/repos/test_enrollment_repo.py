@@ -1,3 +1,6 @@
+from tinydb import TinyDB
+from tinydb.storages import MemoryStorage
+
 from domain.enrollment import Enrollment
 from infra.enumerators.enrollment import EnrollmentStatus
 from infra.repositories.enrollment import EnrollmentRepository
@@ -24,3 +27,146 @@ def test_enrollment_repo_methods(tmp_db):
 
     repo.remove(cpf="123.456.789-09")
     assert repo.count() == 0
+
+
+def test_upsert_pending():
+    repo = EnrollmentRepository(table=TinyDB(storage=MemoryStorage).table("enrollments"))
+    pending = Enrollment(name="Maria", age=20, cpf="123.456.789-09", requested_at=1)
+
+    assert repo.upsert_pending(pending) is None
+    assert repo.upsert_pending(pending) == pending
+    assert repo.count() == 1
+
+    repo.update({"status": EnrollmentStatus.APPROVED.value, "enrolled_at": 2}, cpf=pending.cpf)
+    previous = repo.upsert_pending(pending)
+    assert previous is not None and previous.status is EnrollmentStatus.APPROVED
+    stored = repo.find_by_cpf(pending.cpf)
+    assert stored is not None and stored.status is EnrollmentStatus.APPROVED
+
+
+def test_find_by_cpf_sees_writes_from_other_handles(tmp_path):
+    path = tmp_path / "db.json"
+    api_db, worker_db = TinyDB(path), TinyDB(path)
+    repo = EnrollmentRepository(table=api_db.table("enrollments"))
+    worker = EnrollmentRepository(table=worker_db.table("enrollments"))
+
+    repo.insert(Enrollment(name="Maria", age=20, cpf="123.456.789-09"))
+    assert repo.find_by_cpf("123.456.789-09").status is EnrollmentStatus.PENDING
+
+    worker.update({"status": EnrollmentStatus.APPROVED.value, "enrolled_at": 1_700_000_000}, cpf="123.456.789-09")
+    assert repo.find_by_cpf("123.456.789-09").status is EnrollmentStatus.APPROVED
+    assert repo.find_by_cpf("000.000.000-00") is None
+
+
+def test_exists_by_age_group():
+    db = TinyDB(storage=MemoryStorage)
+    repo = EnrollmentRepository(table=db.table("enrollments"))
+    repo.warm_up()
+    assert not repo.exists_by_age_group("Adult", only_approved=False)
+
+    repo.insert(Enrollment(name="Maria", age=20, cpf="123.456.789-09", age_group_name="Adult"))
+    assert repo.exists_by_age_group("Adult", only_approved=False)
+    assert not repo.exists_by_age_group("Adult")
+
+    repo.update({"status": EnrollmentStatus.APPROVED.value}, cpf="123.456.789-09")
+    assert repo.exists_by_age_group("Adult")
+    assert not repo.exists_by_age_group("Child", only_approved=False)
+
+
+def test_page_by_name():
+    db = TinyDB(storage=MemoryStorage)
+    repo = EnrollmentRepository(table=db.table("enrollments"))
+    repo.insert(Enrollment(name="Maria", age=20, cpf="123.456.789-09"))
+    repo.insert(Enrollment(name="Ana", age=30, cpf="111.444.777-35"))
+    repo.insert(Enrollment(name="Maria", age=40, cpf="529.982.247-25"))
+
+    page, total = repo.page_by_name("Maria", offset=1, limit=5)
+    assert [e.cpf for e in page] == ["529.982.247-25"] and total == 2
+    assert repo.page_by_name("Maria", limit=0) == ([], 2)
+    assert repo.page_by_name("Joana") == ([], 0)
+
+
+def test_page_by_status_follows_writes():
+    db = TinyDB(storage=MemoryStorage)
+    repo = EnrollmentRepository(table=db.table("enrollments"))
+    repo.insert(Enrollment(name="Maria", age=20, cpf="123.456.789-09"))
+    repo.insert(Enrollment(name="Ana", age=30, cpf="111.444.777-35"))
+    assert repo.page_by_status(EnrollmentStatus.PENDING, limit=0) == ([], 2)
+
+    repo.update({"status": EnrollmentStatus.APPROVED.value, "enrolled_at": 1_700_000_000}, cpf="111.444.777-35")
+    page, total = repo.page_by_status(EnrollmentStatus.APPROVED)
+    assert [e.name for e in page] == ["Ana"] and total == 1
+    assert repo.page_by_status(EnrollmentStatus.PENDING)[1] == 1
+
+
+def test_page_by_age_group():
+    db = TinyDB(storage=MemoryStorage)
+    repo = EnrollmentRepository(table=db.table("enrollments"))
+    repo.insert(Enrollment(name="Maria", age=20, cpf="123.456.789-09", age_group_name="Adult"))
+    repo.insert(Enrollment(name="Ana", age=10, cpf="111.444.777-35", age_group_name="Child"))
+
+    page, total = repo.page_by_age_group("Adult")
+    assert [e.name for e in page] == ["Maria"] and total == 1
+    assert repo.page_by_age_group("Senior") == ([], 0)
+
+
+def test_search_after_on_indexed_field_matches_scan():
+    repo = EnrollmentRepository(table=TinyDB(storage=MemoryStorage).table("enrollments"))
+    for i in range(7):
+        group = "Adult" if i % 2 else "Child"
+        repo.insert(Enrollment(name=f"S{i}", age=20, cpf=f"000.000.000-{i:02d}", age_group_name=group))
+
+    pages, cursor = [], None
+    while True:
+        page, cursor = repo.search_after(after=cursor, limit=2, age_group_name="Child")
+        pages.append([e.name for e in page])
+        if cursor is None:
+            break
+    assert pages == [["S0", "S2"], ["S4", "S6"]]
+    assert repo.search_after(after=2, limit=10, age_group_name="Adult", age=20)[0][0].name == "S3"
+
+
+def test_upsert_pending_sees_approval_from_other_handle(tmp_path):
+    db_path = str(tmp_path / "db.json")
+    api = EnrollmentRepository(table=TinyDB(db_path).table("enrollments"))
+    worker = EnrollmentRepository(table=TinyDB(db_path).table("enrollments"))
+    pending = Enrollment(name="Maria", age=20, cpf="123.456.789-09", requested_at=1)
+
+    assert api.upsert_pending(pending) is None
+    worker.update({"status": EnrollmentStatus.APPROVED.value, "enrolled_at": 2}, cpf=pending.cpf)
+
+    previous = api.upsert_pending(pending)
+    assert previous is not None and previous.status is EnrollmentStatus.APPROVED
+
+
+def test_revert_pending_restores_previous_record():
+    repo = EnrollmentRepository(table=TinyDB(storage=MemoryStorage).table("enrollments"))
+    first = Enrollment(name="Maria", age=20, cpf="123.456.789-09", requested_at=1)
+    repo.revert_pending(first, repo.upsert_pending(first))
+    assert repo.find_by_cpf(first.cpf) is None and repo.count() == 0
+
+    rejected = Enrollment(
+        name="Maria", age=20, cpf=first.cpf, status=EnrollmentStatus.REJECTED, requested_at=1, age_group_name="Adult"
+    )
+    repo.insert(rejected)
+    retry = Enrollment(name="Maria", age=21, cpf=first.cpf, requested_at=2)
+    repo.revert_pending(retry, repo.upsert_pending(retry))
+    assert repo.find_by_cpf(first.cpf) == rejected
+
+    previous = repo.upsert_pending(retry)
+    repo.update({"name": "Other"}, cpf=first.cpf)
+    repo.revert_pending(retry, previous)
+    stored = repo.find_by_cpf(first.cpf)
+    assert stored is not None and stored.name == "Other"
+
+
+def test_entities_reused_until_write():
+    repo = EnrollmentRepository(table=TinyDB(storage=MemoryStorage).table("enrollments"))
+    repo.insert(Enrollment(name="Maria", age=20, cpf="123.456.789-09"))
+
+    (first,) = repo.get_all()
+    assert repo.page_by_name("Maria")[0][0] is first
+
+    repo.update({"age": 21}, cpf="123.456.789-09")
+    (updated,) = repo.get_all()
+    assert updated is not first and updated.age == 21
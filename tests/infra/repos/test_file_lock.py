@@ -32,3 +32,16 @@ def test_file_lock(tmp_path):
 
     repo = AgeGroupRepository(table=TinyDB(db_path, storage=JSONStorage).table("age_groups"))
     assert repo.count() == 50
+
+
+def test_inserts_alternating_between_handles(tmp_path):
+    db_path = Path(tmp_path) / "handles.json"
+    first = AgeGroupRepository(table=TinyDB(db_path, storage=JSONStorage).table("age_groups"))
+    second = AgeGroupRepository(table=TinyDB(db_path, storage=JSONStorage).table("age_groups"))
+
+    first.insert(AgeGroup(name="a", age_range=AgeRange(0, 1)))
+    second.insert(AgeGroup(name="b", age_range=AgeRange(2, 3)))
+    first.insert(AgeGroup(name="c", age_range=AgeRange(4, 5)))
+    first.insert(AgeGroup(name="d", age_range=AgeRange(6, 7)))
+
+    assert sorted(g.name for g in second.get_all()) == ["a", "b", "c", "d"]
@@ -1,5 +1,8 @@
+import pytest
+
 from domain.age_group import AgeGroup, AgeRange
 from infra.repositories.age_group import AgeGroupRepository
+from infra.utils.pagination import decode_cursor, encode_cursor
 
 
 def test_pagination_and_search(tmp_db):
@@ -15,3 +18,9 @@ def test_pagination_and_search(tmp_db):
 
     matches = repo.search_by_fields(name="G1")
     assert len(matches) == 1 and matches[0].name == "G1"
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(42)) == 42
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor!")
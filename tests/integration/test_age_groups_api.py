@@ -116,3 +116,11 @@ def test_pagination_params_and_bounds(app_client):
 
     r2 = client.get("/age-groups/?page_size=0")
     assert r2.status_code == 422
+
+
+def test_create_accepts_very_large_max_age(app_client):
+    client, reset = app_client
+    reset()
+    assert client.post("/age-groups/", json={"name": "ANY", "min_age": 0, "max_age": 10**20}).status_code == 201
+    r = client.post("/age-groups/", json={"name": "OTHER", "min_age": 10**19, "max_age": 10**19})
+    assert r.status_code == 409
@@ -188,3 +188,62 @@ def test_get_all_with_pagination(app_client):
     body2 = r2.json()
     assert _total(body2) == 3
     assert len(body2["items"]) == 1
+
+
+def test_get_all_by_cursor_follows_next_page(app_client):
+    client, reset, repo = app_client
+    reset()
+
+    for i in range(3):
+        repo.insert(
+            _mk_enr(name=f"C{i}", age=10, cpf=f"600.000.000-0{i}", status=EnrollmentStatus.REJECTED, group=None)
+        )
+
+    r1 = client.get("/enrollments/admin/all?after=&page_size=2")
+    assert r1.status_code == 200
+    body1 = r1.json()
+    assert [item["name"] for item in body1["items"]] == ["C0", "C1"]
+    assert body1["meta"]["page"] is None and body1["meta"]["total_items"] is None
+    assert body1["links"]["prev_page"] is None
+    cursor = body1["links"]["next_cursor"]
+    assert cursor and f"after={cursor}" in body1["links"]["next_page"]
+
+    body2 = client.get(body1["links"]["next_page"]).json()
+    assert [item["name"] for item in body2["items"]] == ["C2"]
+    assert body2["links"]["next_cursor"] is None and body2["links"]["next_page"] is None
+
+
+def test_filtered_lists_by_cursor(app_client):
+    client, reset, repo = app_client
+    reset()
+
+    repo.insert(_mk_enr(name="Ana", age=20, cpf="700.000.000-01", status=EnrollmentStatus.APPROVED, group="ADULT"))
+    repo.insert(_mk_enr(name="Bia", age=21, cpf="700.000.000-02", status=EnrollmentStatus.REJECTED, group=None))
+    repo.insert(_mk_enr(name="Ana", age=22, cpf="700.000.000-03", status=EnrollmentStatus.APPROVED, group="ADULT"))
+
+    by_group = client.get("/enrollments/admin/by-group/ADULT?after=&page_size=1").json()
+    assert [item["cpf"] for item in by_group["items"]] == ["700.000.000-01"]
+    nxt = client.get(f"/enrollments/admin/by-group/ADULT?after={by_group['links']['next_cursor']}&page_size=1")
+    assert [item["cpf"] for item in nxt.json()["items"]] == ["700.000.000-03"]
+
+    by_name = client.get("/enrollments/admin/by-name?name=Ana&after=").json()
+    assert [item["age"] for item in by_name["items"]] == [20, 22]
+    assert by_name["links"]["next_cursor"] is None
+
+    by_status = client.get("/enrollments/admin/by-status?status=REJECTED&after=").json()
+    assert [item["name"] for item in by_status["items"]] == ["Bia"]
+
+
+def test_list_by_cursor_400_on_bad_cursor(app_client):
+    client, reset, _repo = app_client
+    reset()
+
+    for url in (
+        "/enrollments/admin/all?after=not-a-cursor",
+        "/enrollments/admin/by-group/ADULT?after=%%%",
+        "/enrollments/admin/by-name?name=Ana&after=LTE",
+        "/enrollments/admin/by-status?status=APPROVED&after=!",
+    ):
+        r = client.get(url)
+        assert r.status_code == 400, url
+        assert r.json()["detail"] == "invalid cursor"
@@ -16,13 +16,15 @@ from infra.dependencies.enrollment import provide_use_case
 from infra.repositories.age_group import AgeGroupRepository
 from infra.repositories.enrollment import EnrollmentRepository
 
+FIXED_NOW = 1_700_000_000
+
 
 class _StubPublisher:
     def __init__(self) -> None:
         self.messages: list[dict] = []
         self.fail: bool = False
 
-    def publish(self, payload: dict) -> None:
+    async def publish(self, payload: dict) -> None:
         if self.fail:
             raise RuntimeError("publish failed (stub)")
         self.messages.append(payload)
@@ -39,7 +41,7 @@ def app_client(
     enr_repo = EnrollmentRepository(table=enr_table)
 
     pub = _StubPublisher()
-    svc = EnrollmentService(age_groups=age_repo, enrollments=enr_repo)
+    svc = EnrollmentService(age_groups=age_repo, enrollments=enr_repo, clock=lambda: FIXED_NOW)
     uc = EnrollmentUseCase(service=svc, publisher=pub)
 
     app = FastAPI()
@@ -74,7 +76,11 @@ def test_post_202_enqueues_when_ok(app_client):
     assert msg["cpf"] == "441.354.448-06"
     assert msg["age_group_name"] == "KIDS"
     assert msg["status"] == "PENDING"
-    assert isinstance(msg["requested_at"], int)
+    assert msg["requested_at"] == FIXED_NOW
+
+    r_status = client.get("/enrollments/441.354.448-06")
+    assert r_status.status_code == 200
+    assert r_status.json()["status"] == "PENDING"
 
 
 def test_post_422_when_no_covering_group(app_client):
@@ -149,3 +155,46 @@ def test_post_503_when_publisher_fails(app_client):
     r = client.post("/enrollments/", json={"name": "Eve", "age": 10, "cpf": "999.888.777-66"})
     assert r.status_code == 503
     assert r.json()["detail"] == "service unavailable"
+    assert client.get("/enrollments/999.888.777-66").status_code == 404
+
+
+def test_post_503_keeps_previous_status(app_client):
+    client, reset, age_repo, enr_repo, pub = app_client
+    reset()
+    age_repo.insert(AgeGroup(name="KIDS", age_range=AgeRange(5, 12)))
+    enr_repo.insert(Enrollment(name="Eve", age=10, cpf="999.888.777-66", status=EnrollmentStatus.REJECTED))
+    pub.fail = True
+
+    r = client.post("/enrollments/", json={"name": "Eve", "age": 11, "cpf": "999.888.777-66"})
+    assert r.status_code == 503
+    stored = enr_repo.find_by_cpf("999.888.777-66")
+    assert stored is not None and stored.status is EnrollmentStatus.REJECTED and stored.age == 10
+
+
+def test_get_status_422_for_non_ascii_digits(app_client):
+    client, reset, _age_repo, _enr_repo, _pub = app_client
+    reset()
+    r = client.get("/enrollments/١٢٣.456.789-00")
+    assert r.status_code == 422
+
+
+def test_get_status_revalidates_with_etag(app_client):
+    client, reset, _age_repo, enr_repo, _pub = app_client
+    reset()
+    ent = Enrollment(name="Fay", age=15, cpf="555.666.777-88", status=EnrollmentStatus.PENDING, requested_at=1)
+    enr_repo.insert(ent)
+
+    r = client.get("/enrollments/555.666.777-88")
+    etag = r.headers["etag"]
+    assert r.headers["cache-control"] == "private, no-cache"
+
+    r_same = client.get("/enrollments/555.666.777-88", headers={"If-None-Match": etag})
+    assert r_same.status_code == 304
+    assert r_same.content == b""
+    assert r_same.headers["etag"] == etag
+
+    enr_repo.update({"status": EnrollmentStatus.REJECTED.value}, cpf="555.666.777-88")
+    r_changed = client.get("/enrollments/555.666.777-88", headers={"If-None-Match": etag})
+    assert r_changed.status_code == 200
+    assert r_changed.json()["status"] == "REJECTED"
+    assert r_changed.headers["etag"] != etag